@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+from importlib import import_module
+from typing import Dict, Tuple
+
 from . import model
 
 __all__ = [
@@ -25,66 +28,33 @@ __all__ = [
 ]
 
 
-def __getattr__(name: str):
-    if name in {"DescriptorLoader", "OptionContext", "OptionValidator"}:
-        from .descriptor_loader import DescriptorLoader, OptionContext, OptionValidator
-
-        mapping = {
-            "DescriptorLoader": DescriptorLoader,
-            "OptionContext": OptionContext,
-            "OptionValidator": OptionValidator,
-        }
-        return mapping[name]
-
-    if name in {"DefaultTemplateRenderer", "GeneratedFile", "ITemplateRenderer"}:
-        from .codegen import DefaultTemplateRenderer, GeneratedFile, ITemplateRenderer
-
-        mapping = {
-            "DefaultTemplateRenderer": DefaultTemplateRenderer,
-            "GeneratedFile": GeneratedFile,
-            "ITemplateRenderer": ITemplateRenderer,
-        }
-        return mapping[name]
+# Public attribute -> (module, attribute) resolved on first access.
+_LAZY_ATTRIBUTES: Dict[str, Tuple[str, str]] = {
+    "DescriptorLoader": (".descriptor_loader", "DescriptorLoader"),
+    "OptionContext": (".descriptor_loader", "OptionContext"),
+    "OptionValidator": (".descriptor_loader", "OptionValidator"),
+    "DefaultTemplateRenderer": (".codegen", "DefaultTemplateRenderer"),
+    "GeneratedFile": (".codegen", "GeneratedFile"),
+    "ITemplateRenderer": (".codegen", "ITemplateRenderer"),
+    "GeneratorConfig": (".config", "GeneratorConfig"),
+    "TypeMapper": (".type_mapper", "TypeMapper"),
+    "UEEnum": (".type_mapper", "UEEnum"),
+    "UEEnumValue": (".type_mapper", "UEEnumValue"),
+    "UEField": (".type_mapper", "UEField"),
+    "UEMessage": (".type_mapper", "UEMessage"),
+    "UEOneofCase": (".type_mapper", "UEOneofCase"),
+    "UEOneofWrapper": (".type_mapper", "UEOneofWrapper"),
+    "UEOptionalWrapper": (".type_mapper", "UEOptionalWrapper"),
+    "UEProtoFile": (".type_mapper", "UEProtoFile"),
+}
 
-    if name == "GeneratorConfig":
-        from .config import GeneratorConfig
 
-        return GeneratorConfig
-
-    if name in {
-        "TypeMapper",
-        "UEEnum",
-        "UEEnumValue",
-        "UEField",
-        "UEMessage",
-        "UEOneofCase",
-        "UEOneofWrapper",
-        "UEOptionalWrapper",
-        "UEProtoFile",
-    }:
-        from .type_mapper import (
-            TypeMapper,
-            UEEnum,
-            UEEnumValue,
-            UEField,
-            UEMessage,
-            UEOneofCase,
-            UEOneofWrapper,
-            UEOptionalWrapper,
-            UEProtoFile,
-        )
-
-        mapping = {
-            "TypeMapper": TypeMapper,
-            "UEEnum": UEEnum,
-            "UEEnumValue": UEEnumValue,
-            "UEField": UEField,
-            "UEMessage": UEMessage,
-            "UEOneofCase": UEOneofCase,
-            "UEOneofWrapper": UEOneofWrapper,
-            "UEOptionalWrapper": UEOptionalWrapper,
-            "UEProtoFile": UEProtoFile,
-        }
-        return mapping[name]
-
-    raise AttributeError(name)
+def __getattr__(name: str):
+    try:
+        module_name, attribute = _LAZY_ATTRIBUTES[name]
+    except KeyError:
+        raise AttributeError(name) from None
+    value = getattr(import_module(module_name, __name__), attribute)
+    # Cache on the module so later lookups bypass __getattr__ entirely.
+    globals()[name] = value
+    return value
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Dict, Iterable, List, Optional, Protocol
+from typing import Dict, Iterable, List, Optional, Protocol, Tuple
 
 import hashlib
 import re
@@ -114,6 +114,7 @@ class DefaultTemplateRenderer:
     ) -> None:
         self._header_suffix = header_suffix
         self._source_suffix = source_suffix
+        self._flat_messages: Optional[Tuple[UEProtoFile, List[UEMessage]]] = None
 
     def render(self, ue_file: UEProtoFile) -> Iterable[GeneratedFile]:
         base_name = self._base_name_for(ue_file.name)
@@ -124,8 +125,14 @@ class DefaultTemplateRenderer:
             f"{base_name}{self._source_suffix}"
         )
         registration_symbol = self._registration_symbol(base_name)
-        header_content = self._render_header(header_name, ue_file)
-        source_content = self._render_source(header_name, registration_symbol, ue_file)
+        # The flattened message list is shared by the helpers of this call only;
+        # the file may be edited in place before the next render.
+        self._flat_messages = None
+        try:
+            header_content = self._render_header(header_name, ue_file)
+            source_content = self._render_source(header_name, registration_symbol, ue_file)
+        finally:
+            self._flat_messages = None
         return [
             GeneratedFile(name=header_name, content=header_content),
             GeneratedFile(name=source_name, content=source_content),
@@ -156,7 +163,6 @@ class DefaultTemplateRenderer:
             lines.extend(include_block)
 
         enums = self._collect_enums(ue_file)
-        messages = self._collect_messages(ue_file)
 
         for enum in enums:
             if lines and lines[-1] != "":
@@ -500,15 +506,27 @@ class DefaultTemplateRenderer:
         ]
 
     def _collect_messages(self, ue_file: UEProtoFile) -> List[UEMessage]:
-        collected: List[UEMessage] = []
+        cached = self._flat_messages
+        if cached is not None and cached[0] is ue_file:
+            return cached[1]
 
-        def visit(message: UEMessage) -> None:
-            for nested in message.nested_messages:
-                visit(nested)
-            collected.append(message)
+        # Nested messages are emitted before their parents; walk with an explicit
+        # stack so deep hierarchies do not pay for one Python frame per level.
+        collected: List[UEMessage] = []
+        stack: List[Tuple[UEMessage, bool]] = [
+            (message, False) for message in reversed(ue_file.messages)
+        ]
+        while stack:
+            message, expanded = stack.pop()
+            if expanded:
+                collected.append(message)
+                continue
+            stack.append((message, True))
+            stack.extend(
+                (nested, False) for nested in reversed(message.nested_messages)
+            )
 
-        for message in ue_file.messages:
-            visit(message)
+        self._flat_messages = (ue_file, collected)
         return collected
 
     def _sorted_messages(self, ue_file: UEProtoFile) -> List[UEMessage]:
@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
+import io
+from itertools import product
+import keyword
 from pathlib import PurePosixPath
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+import re
+from string import Template
+import sys
+from types import CodeType
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, TextIO, Tuple
+from weakref import WeakValueDictionary
 
 from .. import model
 from . import sanitize_generated_filename
+from ..config import GeneratorConfig
 from ..type_mapper import UEField, UEMessage, UEProtoFile
 
 
@@ -34,8 +44,7 @@ class ConverterRenderResult:
     source: str
 
 
-@dataclass
-class ConversionError:
+class ConversionError(NamedTuple):
     """Represents an individual conversion error captured at runtime."""
 
     field_path: str
@@ -46,27 +55,99 @@ class ConversionContext:
     """Collects conversion errors for python level validation used in tests."""
 
     def __init__(self) -> None:
-        self._errors: List[ConversionError] = []
+        # Entries are ConversionError instances, or plain (path, message)
+        # pairs whose linked path is only formatted when errors are read.
+        self._errors: List[Tuple[Any, str]] = []
+        self._errors_snapshot: Optional[Tuple[ConversionError, ...]] = ()
+        self._has_errors = False
 
     @property
     def errors(self) -> List[ConversionError]:
-        return list(self._errors)
+        # Formatted entries are kept until the next error; callers still get
+        # their own list.
+        snapshot = self._errors_snapshot
+        if snapshot is None:
+            snapshot = self._errors_snapshot = tuple(
+                entry
+                if entry.__class__ is ConversionError
+                else ConversionError(_format_field_path(entry[0]), entry[1])
+                for entry in self._errors
+            )
+        return list(snapshot)
 
     def add_error(self, field_path: str, message: str) -> None:
-        self._errors.append(ConversionError(field_path=field_path, message=message))
+        self._errors.append(ConversionError(field_path, message))
+        self._errors_snapshot = None
+        self._has_errors = True
+
+    def _add_path_error(self, path: Any, message: str) -> None:
+        self._errors.append((path, message))
+        self._errors_snapshot = None
+        self._has_errors = True
 
     def has_errors(self) -> bool:
-        return bool(self._errors)
+        return self._has_errors
 
 
-class PythonConvertersRuntime:
-    """Runtime helpers that mirror the generated C++ semantics for tests."""
+# Field plan kinds, resolved once per field when a message is registered.
+_PLAN_SCALAR = 0
+_PLAN_MESSAGE = 1
+_PLAN_REPEATED_SCALAR = 2
+_PLAN_REPEATED_MESSAGE = 3
+_PLAN_MAP_SCALAR = 4
+_PLAN_MAP_MESSAGE = 5
+
+
+class _FieldPlan(NamedTuple):
+    field: UEField
+    ue_name: str
+    proto_name: str
+    kind: int
+    child_symbol: Optional[str]
+
 
-    def __init__(self, ue_file: UEProtoFile) -> None:
+_Encoder = Callable[[Dict[str, Any], Any, "ConversionContext", str], None]
+_Decoder = Callable[[Any, Dict[str, Any], "ConversionContext", str], None]
+
+
+class PythonConvertersRuntime:
+    """Runtime helpers that mirror the generated C++ semantics for tests.
+
+    Each registered message gets a specialised encoder/decoder pair compiled
+    from generated Python source, so conversions run straight-line code with
+    field names, oneof groups and nested message dispatch resolved up front.
+    ``google.protobuf.json_format`` is deliberately not used as a shortcut: it
+    renders 64-bit integers as strings, bytes as base64 and enums as names,
+    none of which match the UE-side values produced here.
+    """
+
+    _shared_conversions: "WeakValueDictionary[int, UEMessage]" = WeakValueDictionary()
+
+    def __init__(self, ue_file: UEProtoFile, *, validate_containers: bool = True) -> None:
+        # When disabled, repeated/map values are trusted to be iterables and
+        # dictionaries and the compiled encoders skip the shape checks.
+        self._validate_containers = validate_containers
         self._messages: Dict[str, UEMessage] = {}
         self._external_cache: Dict[str, UEMessage] = {}
+        self._field_plans: Dict[str, List[_FieldPlan]] = {}
+        self._oneof_plans: Dict[str, Dict[str, List[_FieldPlan]]] = {}
+        self._encoders: Dict[str, _Encoder] = {}
+        self._decoders: Dict[str, _Decoder] = {}
+        self._symbols: Dict[str, str] = {}
+        self._taken_symbols: set[str] = set()
+        self._codegen_globals: Dict[str, Any] = {
+            "__builtins__": __builtins__,
+        }
+        self._clear_methods: Dict[type, Optional[Callable[[Any], None]]] = {}
+        # Registration only claims names and queues messages; planning and
+        # compiling then drain the queue, which also picks up any external
+        # dependencies discovered along the way. No recursion is involved,
+        # so deeply nested schemas cannot exhaust the interpreter stack.
+        self._unplanned: List[UEMessage] = []
         for message in ue_file.messages:
             self._register_message(message)
+        while self._unplanned:
+            self._plan_message(self._unplanned.pop())
 
     # Public helpers -----------------------------------------------------
     def to_proto(
@@ -79,14 +160,21 @@ class PythonConvertersRuntime:
         """Populate *proto_instance* from the UE-side dictionary representation."""
 
         ctx = context or ConversionContext()
-        message = self._messages[message_full_name]
+        encoder = self._encoders[message_full_name]
         # Match the behaviour of the generated C++ runtime which clears the
         # output message before populating it to avoid leaking previous data
         # when the same proto instance is reused.
-        clear = getattr(proto_instance, "Clear", None)
-        if callable(clear):
-            clear()
-        self._encode_message(message, ue_value, proto_instance, ctx, field_path="")
+        proto_type = type(proto_instance)
+        try:
+            clear = self._clear_methods[proto_type]
+        except KeyError:
+            clear = getattr(proto_type, "Clear", None)
+            if not callable(clear):
+                clear = None
+            self._clear_methods[proto_type] = clear
+        if clear is not None:
+            clear(proto_instance)
+        encoder(ue_value, proto_instance, ctx, None)
         return proto_instance
 
     def from_proto(
@@ -98,39 +186,72 @@ class PythonConvertersRuntime:
         """Convert *proto_instance* into a UE-side dictionary representation."""
 
         ctx = context or ConversionContext()
-        message = self._messages[message_full_name]
+        decoder = self._decoders[message_full_name]
         result: Dict[str, Any] = {}
-        self._decode_message(message, proto_instance, result, ctx, field_path="")
+        decoder(proto_instance, result, ctx, None)
         return result
 
     # Registration -------------------------------------------------------
     def _register_message(self, message: UEMessage) -> None:
-        if not message.source:
-            raise ValueError("UEMessage is missing original protobuf metadata")
+        pending = [message]
+        while pending:
+            current = pending.pop()
+            if not current.source:
+                raise ValueError("UEMessage is missing original protobuf metadata")
+            full_name = current.source.full_name
+            if full_name in self._messages:
+                continue
+            self._messages[full_name] = current
+            self._unplanned.append(current)
+            pending.extend(current.nested_messages)
+
+    def _plan_message(self, message: UEMessage) -> None:
         full_name = message.source.full_name
-        if full_name in self._messages:
-            return
-        self._messages[full_name] = message
-        for nested in message.nested_messages:
-            self._register_message(nested)
-        self._register_field_dependencies(message)
-
-    def _register_field_dependencies(self, message: UEMessage) -> None:
-        for field in message.fields:
-            source = field.source
-            if source is None:
-                raise ValueError(f"Field '{field.name}' is missing source metadata")
-            if field.kind is model.FieldKind.MESSAGE:
-                resolved = source.resolved_type
-                if isinstance(resolved, model.Message):
-                    self._ensure_model_message_registered(resolved)
-            if field.is_map and source.map_entry:
-                entry = source.map_entry
-                if (
-                    entry.value_kind is model.FieldKind.MESSAGE
-                    and isinstance(entry.value_resolved_type, model.Message)
-                ):
-                    self._ensure_model_message_registered(entry.value_resolved_type)
+        plans = [self._plan_field(field) for field in message.fields]
+        oneof_plans: Dict[str, List[_FieldPlan]] = {}
+        for plan in plans:
+            if plan.field.oneof_group:
+                group = sys.intern(plan.field.oneof_group)
+                oneof_plans.setdefault(group, []).append(plan)
+        self._field_plans[full_name] = plans
+        self._oneof_plans[full_name] = oneof_plans
+        self._compile_message(message)
+
+    def _plan_field(self, field: UEField) -> _FieldPlan:
+        """Classify *field* and register any message type it depends on."""
+
+        source = field.source
+        if source is None:
+            raise ValueError(f"Field '{field.name}' is missing source metadata")
+        child_symbol: Optional[str] = None
+        if field.is_map:
+            map_entry = source.map_entry
+            if map_entry is None:
+                raise ValueError("Map field is missing map entry metadata")
+            if map_entry.value_kind is model.FieldKind.MESSAGE:
+                child = map_entry.value_resolved_type
+                if not isinstance(child, model.Message):
+                    raise ValueError("Map value type metadata is not a message")
+                kind = _PLAN_MAP_MESSAGE
+                self._ensure_model_message_registered(child)
+                child_symbol = self._symbol_for(child.full_name)
+            else:
+                kind = _PLAN_MAP_SCALAR
+        elif field.kind is model.FieldKind.MESSAGE:
+            resolved = source.resolved_type
+            if not isinstance(resolved, model.Message):
+                raise ValueError("Expected field resolved type to be a message")
+            kind = _PLAN_REPEATED_MESSAGE if field.is_repeated else _PLAN_MESSAGE
+            self._ensure_model_message_registered(resolved)
+            child_symbol = self._symbol_for(resolved.full_name)
+        else:
+            kind = _PLAN_REPEATED_SCALAR if field.is_repeated else _PLAN_SCALAR
+        # Names are used as dict keys throughout generation and by callers
+        # building UE dictionaries from the mapped fields; storing the interned
+        # strings back lets those lookups short-circuit on identity.
+        field.name = ue_name = sys.intern(field.name)
+        source.name = proto_name = sys.intern(source.name)
+        return _FieldPlan(field, ue_name, proto_name, kind, child_symbol)
 
     def _ensure_model_message_registered(self, message: model.Message) -> UEMessage:
         existing = self._messages.get(message.full_name)
@@ -147,6 +268,12 @@ class PythonConvertersRuntime:
         cached = self._external_cache.get(message.full_name)
         if cached is not None:
             return cached
+        # Runtimes built over the same schema objects share the converted
+        # messages; an entry lives as long as some runtime still uses it.
+        shared = PythonConvertersRuntime._shared_conversions.get(id(message))
+        if shared is not None and shared.source is message:
+            self._external_cache[message.full_name] = shared
+            return shared
 
         ue_message = UEMessage(
             name=message.name,
@@ -163,6 +290,7 @@ class PythonConvertersRuntime:
             source=message,
         )
         self._external_cache[message.full_name] = ue_message
+        PythonConvertersRuntime._shared_conversions[id(message)] = ue_message
 
         ue_message.fields = [self._convert_model_field(field) for field in message.fields]
         ue_message.nested_messages = [
@@ -214,1167 +342,1387 @@ class PythonConvertersRuntime:
             source=field,
         )
 
-    # Encoding helpers ---------------------------------------------------
-    def _encode_message(
-        self,
-        message: UEMessage,
-        ue_value: Dict[str, Any],
-        proto_instance: Any,
-        context: ConversionContext,
-        *,
-        field_path: str,
-    ) -> None:
-        oneof_groups = self._group_oneof_fields(message.fields)
-
-        for group_name, group_fields in oneof_groups.items():
-            provided = [
-                field
-                for field in group_fields
-                if self._is_value_provided(field, ue_value.get(field.name))
+    # Code generation ----------------------------------------------------
+    def _compile_message(self, message: UEMessage) -> None:
+        full_name = message.source.full_name
+        symbol = self._symbol_for(full_name)
+        encoder_name = f"_encode_{symbol}"
+        decoder_name = f"_decode_{symbol}"
+        source = "\n".join(
+            [
+                *self._build_encoder_source(full_name, encoder_name),
+                "",
+                *self._build_decoder_source(full_name, decoder_name),
+                "",
             ]
-            if len(provided) > 1:
-                context.add_error(
-                    self._join_field_path(field_path, group_name),
-                    "Multiple values provided for oneof",
-                )
-
-        for field in message.fields:
-            value = ue_value.get(field.name)
-            field_model = field.source
-            if field_model is None:
-                raise ValueError(f"Field '{field.name}' is missing source metadata")
-            proto_field_name = field_model.name
-            child_path = self._join_field_path(field_path, proto_field_name)
-
-            if field.oneof_group:
-                if not self._is_value_provided(field, value):
-                    # oneof unset, skip entirely
-                    continue
-            elif field.is_optional:
-                if not self._is_value_provided(field, value):
-                    continue
-            elif field.is_map:
-                value = value or {}
-            elif field.is_repeated:
-                value = value or []
+        )
+        # Functions are defined directly in the shared globals so generated
+        # code can call nested encoders/decoders by name, whichever order the
+        # messages are compiled in.
+        code = _compile_converters_source(source, f"<proto2ue converters {full_name}>")
+        exec(code, self._codegen_globals)
+        self._encoders[full_name] = self._codegen_globals[encoder_name]
+        self._decoders[full_name] = self._codegen_globals[decoder_name]
+
+    def _symbol_for(self, full_name: str) -> str:
+        symbol = self._symbols.get(full_name)
+        if symbol is not None:
+            return symbol
+        base = re.sub(r"\W", "_", full_name)
+        symbol = base
+        index = 1
+        while symbol in self._taken_symbols:
+            symbol = f"{base}_{index}"
+            index += 1
+        self._symbols[full_name] = symbol
+        self._taken_symbols.add(symbol)
+        return symbol
+
+    def _build_encoder_source(self, full_name: str, function_name: str) -> List[str]:
+        lines = [f"def {function_name}(ue_value, proto_instance, context, field_path):"]
+
+        # Oneof exclusivity is counted while the members are encoded and
+        # reported once every field has been visited.
+        oneof_counters: Dict[str, str] = {}
+        for group_name in self._oneof_plans[full_name]:
+            counter = f"provided_{len(oneof_counters)}"
+            oneof_counters[group_name] = counter
+            lines.append(f"    {counter} = 0")
+
+        for plan in self._field_plans[full_name]:
+            field = plan.field
+            kind = plan.kind
+            lines.append(f"    value = ue_value.get({plan.ue_name!r})")
+            if kind is _PLAN_SCALAR:
+                # Scalars only need their path when reporting an error, so the
+                # tuple is built inline on those branches instead of per call.
+                path_expr = f"(field_path, {plan.proto_name!r})"
             else:
-                if value is None:
-                    context.add_error(child_path, "Required field missing")
-                    continue
-
-            if field.is_optional:
-                provided, value = self._unwrap_optional_value(field, value, context, child_path)
-                if not provided:
-                    continue
-
-            if field.is_map:
-                self._encode_map_field(field, value, proto_instance, context, child_path)
-            elif field.is_repeated:
-                self._encode_repeated_field(field, value, proto_instance, context, child_path)
+                path_expr = "child_path"
+                lines.append(f"    child_path = (field_path, {plan.proto_name!r})")
+            if field.oneof_group:
+                counter = oneof_counters[field.oneof_group]
+                lines.append(f"    if {self._provided_expr(field, 'value')}:")
+                lines.append(f"        {counter} += 1")
+            if field.oneof_group or field.is_optional:
+                lines.append("    if value is not None:")
+                if field.is_optional and field.optional_wrapper is not None:
+                    body = self._emit_unwrap_optional(plan, path_expr)
+                else:
+                    body = self._emit_encode_value(plan)
+                lines.extend(self._indent(body, 2))
+            elif kind is _PLAN_MAP_SCALAR or kind is _PLAN_MAP_MESSAGE:
+                lines.append("    value = value or {}")
+                lines.extend(self._indent(self._emit_encode_value(plan), 1))
+            elif kind is _PLAN_REPEATED_SCALAR or kind is _PLAN_REPEATED_MESSAGE:
+                lines.append("    value = value or []")
+                lines.extend(self._indent(self._emit_encode_value(plan), 1))
             else:
-                self._encode_singular_field(
-                    field, value, proto_instance, context, child_path
+                lines.append("    if value is None:")
+                lines.append(
+                    f"        context._add_path_error({path_expr}, \"Required field missing\")"
                 )
+                lines.append("    else:")
+                lines.extend(self._indent(self._emit_encode_value(plan), 2))
 
-    def _encode_map_field(
-        self,
-        field: UEField,
-        value: Dict[Any, Any],
-        proto_instance: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> None:
-        if not isinstance(value, dict):
-            context.add_error(field_path, "Map field expects a dictionary value")
-            return
+        for group_name, counter in oneof_counters.items():
+            lines.append(f"    if {counter} > 1:")
+            lines.append(
+                f"        context._add_path_error((field_path, {group_name!r}), "
+                "\"Multiple values provided for oneof\")"
+            )
 
-        container = getattr(proto_instance, field.source.name)
-        container.clear()
+        lines.append("    return None")
+        return lines
 
-        map_entry = field.source.map_entry
-        if map_entry is None:
-            raise ValueError("Map field is missing map entry metadata")
+    def _emit_unwrap_optional(self, plan: _FieldPlan, path_expr: str) -> List[str]:
+        wrapper = plan.field.optional_wrapper
+        return [
+            "if not isinstance(value, dict):",
+            f"    context._add_path_error({path_expr}, "
+            "\"Optional field expects a dictionary with wrapper members\")",
+            f"elif value.get({wrapper.is_set_member!r}):",
+            f"    if {wrapper.value_member!r} not in value:",
+            f"        context._add_path_error({path_expr}, "
+            f"{f'Optional wrapper missing {wrapper.value_member!r} member'!r})",
+            "    else:",
+            f"        value = value[{wrapper.value_member!r}]",
+            *self._indent(self._emit_encode_value(plan), 2),
+        ]
 
-        for key, item in value.items():
-            if map_entry.value_kind is model.FieldKind.MESSAGE:
-                target = container[key]
-                message = map_entry.value_resolved_type
-                if not isinstance(message, model.Message):
-                    raise ValueError("Map value type metadata is not a message")
-                ue_message = self._messages[message.full_name]
-                self._encode_message(
-                    ue_message,
-                    item,
-                    target,
-                    context,
-                    field_path=self._join_field_path(field_path, str(key)),
-                )
+    def _emit_encode_value(self, plan: _FieldPlan) -> List[str]:
+        # to_proto clears the root message first, so every container reached
+        # from it starts out empty and needs no clearing of its own.
+        kind = plan.kind
+        container_expr = _attribute_expr("proto_instance", plan.proto_name)
+        if kind is _PLAN_MAP_SCALAR or kind is _PLAN_MAP_MESSAGE:
+            body = [f"container = {container_expr}"]
+            if kind is _PLAN_MAP_MESSAGE:
+                # Per-element calls go through a local rather than a global.
+                body.append(f"encode_item = _encode_{plan.child_symbol}")
+                body.append("for key, item in value.items():")
+                body.append("    encode_item(item, container[key], context, (child_path, key))")
             else:
-                container[key] = item
-
-    def _encode_repeated_field(
-        self,
-        field: UEField,
-        value: Iterable[Any],
-        proto_instance: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> None:
-        if not isinstance(value, Iterable) or isinstance(value, (str, bytes)):
-            context.add_error(field_path, "Repeated field expects an iterable")
-            return
+                body.append("for key, item in value.items():")
+                body.append("    container[key] = item")
+            return self._guard_container(
+                body,
+                "not isinstance(value, dict)",
+                "Map field expects a dictionary value",
+            )
 
-        container = getattr(proto_instance, field.source.name)
-        container.clear()
+        if kind is _PLAN_REPEATED_SCALAR or kind is _PLAN_REPEATED_MESSAGE:
+            body = [f"container = {container_expr}"]
+            if kind is _PLAN_REPEATED_MESSAGE:
+                # Bind the container method once rather than per element.
+                body.append("add = container.add")
+                body.append(f"encode_item = _encode_{plan.child_symbol}")
+                body.append("for idx, item in enumerate(value):")
+                body.append("    encode_item(item, add(), context, (child_path, idx))")
+            else:
+                # A single slice assignment replaces the contents in bulk.
+                body.append("container[:] = value")
+            # Concrete list/tuple checks first; the duck-typed __iter__ probe
+            # avoids the ABC machinery behind isinstance(Iterable).
+            invalid_expr = (
+                "value.__class__ is not list and value.__class__ is not tuple and ("
+                "isinstance(value, (str, bytes, bytearray, memoryview)) or not hasattr(value, \"__iter__\"))"
+            )
+            return self._guard_container(
+                body, invalid_expr, "Repeated field expects an iterable"
+            )
 
-        if field.kind is model.FieldKind.MESSAGE:
-            for idx, item in enumerate(value):
-                target = container.add()
-                ue_message = self._child_message(field)
-                self._encode_message(
-                    ue_message,
-                    item,
-                    target,
-                    context,
-                    field_path=self._join_field_path(field_path, str(idx)),
-                )
-        else:
-            container.extend(value)
+        if kind is _PLAN_MESSAGE:
+            return [
+                f"_encode_{plan.child_symbol}(value, {container_expr}, context, child_path)"
+            ]
+        return [_assignment_stmt("proto_instance", plan.proto_name, "value")]
+
+    def _guard_container(self, body: List[str], invalid_expr: str, message: str) -> List[str]:
+        if not self._validate_containers:
+            return body
+        return [
+            f"if {invalid_expr}:",
+            f"    context._add_path_error(child_path, {message!r})",
+            "else:",
+            *self._indent(body, 1),
+        ]
 
-    def _encode_singular_field(
-        self,
-        field: UEField,
-        value: Any,
-        proto_instance: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> None:
-        if field.kind is model.FieldKind.MESSAGE:
-            target = getattr(proto_instance, field.source.name)
-            ue_message = self._child_message(field)
-            self._encode_message(
-                ue_message,
-                value,
-                target,
-                context,
-                field_path=field_path,
-            )
-        else:
-            setattr(proto_instance, field.source.name, value)
+    def _build_decoder_source(self, full_name: str, function_name: str) -> List[str]:
+        lines = [f"def {function_name}(proto_instance, result, context, field_path):"]
 
-    # Decoding helpers ---------------------------------------------------
-    def _decode_message(
-        self,
-        message: UEMessage,
-        proto_instance: Any,
-        result: Dict[str, Any],
-        context: ConversionContext,
-        *,
-        field_path: str,
-    ) -> None:
-        oneof_groups = self._group_oneof_fields(message.fields)
-        for group_name, fields in oneof_groups.items():
-            active = proto_instance.WhichOneof(group_name)
-            for field in fields:
-                child_path = self._join_field_path(field_path, field.source.name)
-                if field.source.name == active:
-                    value = self._decode_field_value(
-                        field,
-                        getattr(proto_instance, field.source.name),
-                        context,
-                        child_path,
-                        active=True,
-                    )
-                    if field.is_optional:
-                        value = self._build_optional_output(field, True, value)
-                    result[field.name] = value
-                else:
-                    if field.is_optional:
-                        result[field.name] = self._build_optional_output(field, False, None)
-                    else:
-                        result[field.name] = None
+        for group_name, group_plans in self._oneof_plans[full_name].items():
+            # Every member starts unset; at most one active case is then
+            # decoded, and the whole chain is skipped when none is set.
+            for plan in group_plans:
+                lines.append(
+                    f"    result[{plan.ue_name!r}] = {self._optional_output_expr(plan.field, False)}"
+                )
+            lines.append(f"    active = proto_instance.WhichOneof({group_name!r})")
+            lines.append("    if active is not None:")
+            for index, plan in enumerate(group_plans):
+                branch = "if" if index == 0 else "elif"
+                lines.append(f"        {branch} active == {plan.proto_name!r}:")
+                lines.extend(self._indent(self._emit_decode_value(plan), 3))
+                lines.append(
+                    f"            result[{plan.ue_name!r}] = {self._optional_output_expr(plan.field, True)}"
+                )
 
-        for field in message.fields:
+        for index, plan in enumerate(self._field_plans[full_name]):
+            field = plan.field
             if field.oneof_group:
                 continue
-            child_path = self._join_field_path(field_path, field.source.name)
-            if field.is_map:
-                result[field.name] = self._decode_map_field(
-                    field, getattr(proto_instance, field.source.name), context, child_path
-                )
-            elif field.is_repeated:
-                result[field.name] = self._decode_repeated_field(
-                    field, getattr(proto_instance, field.source.name), context, child_path
+            kind = plan.kind
+            container_expr = _attribute_expr("proto_instance", plan.proto_name)
+            if kind is _PLAN_MAP_MESSAGE:
+                lines.append("    value = {}")
+                lines.append(
+                    f"    child_path = (field_path, {plan.proto_name!r})"
                 )
-            elif field.is_optional:
-                result[field.name] = self._decode_optional_field(
-                    field, proto_instance, context, child_path
+                lines.append(f"    decode_item = _decode_{plan.child_symbol}")
+                lines.append(f"    for key, item in {container_expr}.items():")
+                lines.append("        child_result = {}")
+                lines.append("        decode_item(item, child_result, context, (child_path, key))")
+                lines.append("        value[key] = child_result")
+                lines.append(f"    result[{plan.ue_name!r}] = value")
+            elif kind is _PLAN_MAP_SCALAR:
+                lines.append("    value = {}")
+                lines.append(f"    value.update({container_expr})")
+                lines.append(f"    result[{plan.ue_name!r}] = value")
+            elif kind is _PLAN_REPEATED_MESSAGE:
+                lines.append(
+                    f"    child_path = (field_path, {plan.proto_name!r})"
                 )
-            elif field.kind is model.FieldKind.MESSAGE:
-                if self._has_proto_field(proto_instance, field):
-                    result[field.name] = self._decode_message_field(
-                        field, getattr(proto_instance, field.source.name), context, child_path
-                    )
+                lines.append("    value = []")
+                lines.append("    append = value.append")
+                lines.append(f"    decode_item = _decode_{plan.child_symbol}")
+                lines.append(f"    for idx, item in enumerate({container_expr}):")
+                lines.append("        child_result = {}")
+                lines.append("        decode_item(item, child_result, context, (child_path, idx))")
+                lines.append("        append(child_result)")
+                lines.append(f"    result[{plan.ue_name!r}] = value")
+            elif kind is _PLAN_REPEATED_SCALAR:
+                lines.append(f"    result[{plan.ue_name!r}] = list({container_expr})")
+            elif field.is_optional or kind is _PLAN_MESSAGE:
+                if kind is _PLAN_MESSAGE:
+                    # Singular message fields always track presence.
+                    presence_expr = f"proto_instance.HasField({plan.proto_name!r})"
                 else:
-                    result[field.name] = None
+                    check_name = f"_has_{self._symbol_for(full_name)}_{index}"
+                    self._codegen_globals[check_name] = self._presence_resolver(
+                        check_name, plan.proto_name
+                    )
+                    presence_expr = f"{check_name}(proto_instance)"
+                lines.append(f"    if {presence_expr}:")
+                lines.extend(self._indent(self._emit_decode_value(plan), 2))
+                lines.append(
+                    f"        result[{plan.ue_name!r}] = {self._optional_output_expr(field, True)}"
+                )
+                lines.append("    else:")
+                lines.append(
+                    f"        result[{plan.ue_name!r}] = {self._optional_output_expr(field, False)}"
+                )
             else:
-                result[field.name] = getattr(proto_instance, field.source.name)
+                lines.append(f"    result[{plan.ue_name!r}] = {container_expr}")
 
-    def _decode_field_value(
-        self,
-        field: UEField,
-        value: Any,
-        context: ConversionContext,
-        field_path: str,
-        *,
-        active: bool = False,
-    ) -> Any:
-        if field.kind is model.FieldKind.MESSAGE:
-            ue_message = self._child_message(field)
-            result: Dict[str, Any] = {}
-            self._decode_message(ue_message, value, result, context, field_path=field_path)
-            return result
-        return value
+        lines.append("    return None")
+        return lines
 
-    def _decode_map_field(
-        self,
-        field: UEField,
-        container: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> Dict[Any, Any]:
-        result: Dict[Any, Any] = {}
-        map_entry = field.source.map_entry
-        if map_entry is None:
-            raise ValueError("Map field missing map entry metadata")
-        if map_entry.value_kind is model.FieldKind.MESSAGE:
-            ue_message = self._messages[map_entry.value_resolved_type.full_name]  # type: ignore[arg-type]
-            for key, value in container.items():
-                child_result: Dict[str, Any] = {}
-                self._decode_message(
-                    ue_message,
-                    value,
-                    child_result,
-                    context,
-                    field_path=self._join_field_path(field_path, str(key)),
-                )
-                result[key] = child_result
-        else:
-            result.update(container)
-        return result
+    def _presence_resolver(self, check_name: str, field_name: str) -> Callable[[Any], bool]:
+        # Whether HasField applies depends on the proto descriptor, which is
+        # only known on first use; the resolver then replaces itself with the
+        # specialised check so later calls skip this step.
+        def resolve(proto_instance: Any) -> bool:
+            check = _resolve_presence_check(proto_instance, field_name)
+            self._codegen_globals[check_name] = check
+            return check(proto_instance)
+
+        return resolve
+
+    def _emit_decode_value(self, plan: _FieldPlan) -> List[str]:
+        container_expr = _attribute_expr("proto_instance", plan.proto_name)
+        if plan.kind is _PLAN_MESSAGE:
+            return [
+                "value = {}",
+                f"_decode_{plan.child_symbol}({container_expr}, value, context, "
+                f"(field_path, {plan.proto_name!r}))",
+            ]
+        return [f"value = {container_expr}"]
 
-    def _decode_repeated_field(
-        self,
-        field: UEField,
-        container: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> List[Any]:
-        if field.kind is model.FieldKind.MESSAGE:
-            ue_message = self._child_message(field)
-            result: List[Any] = []
-            for idx, value in enumerate(container):
-                child_result: Dict[str, Any] = {}
-                self._decode_message(
-                    ue_message,
-                    value,
-                    child_result,
-                    context,
-                    field_path=self._join_field_path(field_path, str(idx)),
-                )
-                result.append(child_result)
-            return result
-        return list(container)
+    def _provided_expr(self, field: UEField, value_expr: str) -> str:
+        wrapper = field.optional_wrapper
+        if wrapper is None:
+            return f"{value_expr} is not None"
+        return (
+            f"{value_expr} is not None and (not isinstance({value_expr}, dict) "
+            f"or {value_expr}.get({wrapper.is_set_member!r}))"
+        )
 
-    def _decode_message_field(
-        self,
-        field: UEField,
-        value: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> Any:
-        ue_message = self._child_message(field)
-        result: Dict[str, Any] = {}
-        self._decode_message(ue_message, value, result, context, field_path=field_path)
-        return result
+    def _optional_output_expr(self, field: UEField, is_set: bool) -> str:
+        wrapper = field.optional_wrapper
+        if wrapper is None or not field.is_optional:
+            return "value" if is_set else "None"
+        value_expr = "value" if is_set else "None"
+        return (
+            f"{{{wrapper.is_set_member!r}: {is_set}, {wrapper.value_member!r}: {value_expr}}}"
+        )
 
-    # Utility helpers ----------------------------------------------------
-    def _child_message(self, field: UEField) -> UEMessage:
-        resolved = field.source.resolved_type
-        if not isinstance(resolved, model.Message):
-            raise ValueError("Expected field resolved type to be a message")
-        return self._messages[resolved.full_name]
+    def _indent(self, lines: Iterable[str], level: int) -> List[str]:
+        pad = "    " * level
+        return [f"{pad}{line}" for line in lines]
 
-    def _group_oneof_fields(self, fields: Iterable[UEField]) -> Dict[str, List[UEField]]:
-        groups: Dict[str, List[UEField]] = {}
-        for field in fields:
-            if field.oneof_group:
-                groups.setdefault(field.oneof_group, []).append(field)
-        return groups
-
-    def _is_value_provided(self, field: UEField, value: Any) -> bool:
-        if value is None:
-            return False
-        if field.optional_wrapper is not None and isinstance(value, dict):
-            wrapper = field.optional_wrapper
-            return bool(value.get(wrapper.is_set_member))
-        return True
 
-    def _unwrap_optional_value(
-        self,
-        field: UEField,
-        value: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> Tuple[bool, Any]:
-        wrapper = field.optional_wrapper
-        if wrapper is None:
-            return True, value
-        if not isinstance(value, dict):
-            context.add_error(
-                field_path,
-                "Optional field expects a dictionary with wrapper members",
-            )
-            return False, None
-        is_set = bool(value.get(wrapper.is_set_member))
-        if not is_set:
-            return False, None
-        if wrapper.value_member not in value:
-            context.add_error(
-                field_path,
-                f"Optional wrapper missing '{wrapper.value_member}' member",
-            )
-            return False, None
-        return True, value.get(wrapper.value_member)
+@lru_cache(maxsize=1024)
+def _compile_converters_source(source: str, filename: str) -> CodeType:
+    # Code objects are immutable and independent of the globals they are
+    # executed in, so runtimes built for the same schema share them.
+    return compile(source, filename, "exec")
 
-    def _decode_optional_field(
-        self,
-        field: UEField,
-        proto_instance: Any,
-        context: ConversionContext,
-        field_path: str,
-    ) -> Any:
-        if self._has_proto_field(proto_instance, field):
-            if field.kind is model.FieldKind.MESSAGE:
-                decoded = self._decode_message_field(
-                    field, getattr(proto_instance, field.source.name), context, field_path
-                )
-            else:
-                decoded = getattr(proto_instance, field.source.name)
-            return self._build_optional_output(field, True, decoded)
-        return self._build_optional_output(field, False, None)
 
-    def _build_optional_output(self, field: UEField, is_set: bool, value: Any) -> Any:
-        wrapper = field.optional_wrapper
-        if wrapper is None:
-            return value if is_set else None
-        return {
-            wrapper.is_set_member: bool(is_set),
-            wrapper.value_member: value,
-        }
+# Field paths are built as linked ``(parent, name)`` pairs rooted at ``None``
+# and only formatted into dotted strings when the errors are read.
+def _format_field_path(path: Any) -> str:
+    parts: List[str] = []
+    while path is not None:
+        path, name = path
+        parts.append(str(name))
+    parts.reverse()
+    return ".".join(parts)
 
-    def _join_field_path(self, parent: str, name: str) -> str:
-        if not parent:
-            return name
-        return f"{parent}.{name}"
 
-    def _has_proto_field(self, proto_instance: Any, field: UEField) -> bool:
-        field_name = field.source.name
-        if field.oneof_group:
-            return proto_instance.WhichOneof(field.oneof_group) == field_name
+def _resolve_presence_check(proto_instance: Any, field_name: str) -> Callable[[Any], bool]:
+    """Pick how presence is tested for *field_name*, once per message type."""
+
+    descriptor = proto_instance.DESCRIPTOR.fields_by_name[field_name]
+    if descriptor.label == descriptor.LABEL_REPEATED:
+        return lambda message: len(getattr(message, field_name)) > 0
+    has_presence = getattr(descriptor, "has_presence", None)
+    if has_presence is None:
         try:
-            return proto_instance.HasField(field_name)
+            proto_instance.HasField(field_name)
         except ValueError:
-            descriptor = proto_instance.DESCRIPTOR.fields_by_name[field_name]
-            if descriptor.label == descriptor.LABEL_REPEATED:
-                return len(getattr(proto_instance, field_name)) > 0
-            value = getattr(proto_instance, field_name)
-            default = descriptor.default_value
-            return value != default
+            has_presence = False
+        else:
+            has_presence = True
+    if has_presence:
+        return lambda message: message.HasField(field_name)
+    default = descriptor.default_value
+    return lambda message: getattr(message, field_name) != default
+
+
+def _attribute_expr(target: str, name: str) -> str:
+    if keyword.iskeyword(name):
+        return f"getattr({target}, {name!r})"
+    return f"{target}.{name}"
+
+
+def _assignment_stmt(target: str, name: str, value_expr: str) -> str:
+    if keyword.iskeyword(name):
+        return f"setattr({target}, {name!r}, {value_expr})"
+    return f"{target}.{name} = {value_expr}"
+
+
+# Static C++ fragments shared by every rendered file. They are built once at
+# import time; per-file values are filled in with ``string.Template``.
+_CONTEXT_DECLARATION = """\
+    struct FConversionError { FString Message; FString FieldPath; };
+    class FConversionContext {
+    public:
+        void AddError(const FString& InFieldPath, const FString& InMessage);
+        bool HasErrors() const;
+        const TArray<FConversionError>& GetErrors() const;
+    private:
+        TArray<FConversionError> Errors;
+    };"""
+
+_CONTEXT_DEFINITIONS = Template("""\
+void ${class_name}::FConversionContext::AddError(const FString& InFieldPath, const FString& InMessage) {
+    Errors.Emplace(FConversionError{InMessage, InFieldPath});
+}
+bool ${class_name}::FConversionContext::HasErrors() const { return Errors.Num() > 0; }
+const TArray<${class_name}::FConversionError>& ${class_name}::FConversionContext::GetErrors() const { return Errors; }""")
+
+_CONVERTER_DECLARATIONS = Template("""\
+    static void ToProto(const ${ue_type}& Source, ${proto_type}& Out, FConversionContext* Context = nullptr);
+    static bool FromProto(const ${proto_type}& Source, ${ue_type}& Out, FConversionContext* Context = nullptr);
+
+""")
+
+_TO_PROTO_FUNCTION_OPEN = Template("""\
+void ${class_name}::ToProto(const ${ue_type}& Source, ${proto_type}& Out, FConversionContext* Context) {
+    Out.Clear();
+""")
+
+_FROM_PROTO_FUNCTION_OPEN = Template("""\
+bool ${class_name}::FromProto(const ${proto_type}& Source, ${ue_type}& Out, FConversionContext* Context) {
+    Out = {};
+    bool bOk = true;
+""")
+
+_FROM_PROTO_FUNCTION_CLOSE = """\
+    return bOk && (!Context || !Context->HasErrors());
+}"""
+
+_FORMAT_ERRORS_HELPER = Template("""\
+namespace {
+FString FormatConversionErrors(const ${class_name}::FConversionContext& Context) {
+    FString Combined;
+    const auto& Errors = Context.GetErrors();
+    for (const auto& ConversionError : Errors) {
+        if (!Combined.IsEmpty()) {
+            Combined += TEXT("; ");
+        }
+        if (!ConversionError.FieldPath.IsEmpty()) {
+            Combined += ConversionError.FieldPath;
+            Combined += TEXT(": ");
+        }
+        Combined += ConversionError.Message;
+    }
+    if (Combined.IsEmpty()) {
+        return FString(TEXT("Unknown conversion error."));
+    }
+    return Combined;
+}
+}  // namespace""")
+
+_BLUEPRINT_BYTES_FUNCTIONS = Template("""\
+bool UProto2UEBlueprintLibrary::${base_name}ToProtoBytes(const ${ue_type}& Source, TArray<uint8>& OutBytes, FString& Error) {
+    ${class_name}::FConversionContext Context;
+    ${proto_type} ProtoMessage;
+    ${class_name}::ToProto(Source, ProtoMessage, &Context);
+    if (Context.HasErrors()) {
+        Error = FormatConversionErrors(Context);
+        return false;
+    }
+    if (!ProtoMessage.IsInitialized()) {
+        Error = TEXT("Failed to serialize protobuf message.");
+        return false;
+    }
+    const size_t ByteSize = ProtoMessage.ByteSizeLong();
+    if (ByteSize > static_cast<size_t>(MAX_int32)) {
+        Error = TEXT("Serialized protobuf message is too large.");
+        return false;
+    }
+    OutBytes.SetNumUninitialized(static_cast<int32>(ByteSize));
+    if (ByteSize > 0) {
+        ProtoMessage.SerializeWithCachedSizesToArray(OutBytes.GetData());
+    }
+    Error = FString();
+    return true;
+}
+
+bool UProto2UEBlueprintLibrary::${base_name}FromProtoBytes(const TArray<uint8>& InBytes, ${ue_type}& OutData, FString& Error) {
+    ${proto_type} ProtoMessage;
+    if (!ProtoMessage.ParseFromArray(InBytes.GetData(), InBytes.Num())) {
+        Error = TEXT("Failed to parse protobuf bytes.");
+        return false;
+    }
+    ${class_name}::FConversionContext Context;
+    if (!${class_name}::FromProto(ProtoMessage, OutData, &Context)) {
+        Error = FormatConversionErrors(Context);
+        return false;
+    }
+    Error = FString();
+    return true;
+}""")
+
+# Scalar types that need a conversion helper call in generated C++. Map keys
+# can only be strings among these, so bytes are not listed for them.
+_TO_PROTO_SCALAR_HELPERS = {"string": "ToProtoString", "bytes": "ToProtoBytes"}
+_FROM_PROTO_SCALAR_HELPERS = {"string": "FromProtoString", "bytes": "FromProtoBytes"}
+_TO_PROTO_KEY_HELPERS = {"string": "ToProtoString"}
+_FROM_PROTO_KEY_HELPERS = {"string": "FromProtoString"}
+
+
+# Proto scalars stored in RepeatedField<T> mapped to the UE element type with
+# the same layout.
+_BULK_COPY_SCALARS = {
+    "double": "double",
+    "float": "float",
+    "int64": "int64",
+    "uint64": "uint64",
+    "int32": "int32",
+    "fixed64": "uint64",
+    "fixed32": "uint32",
+    "bool": "bool",
+    "uint32": "uint32",
+    "sfixed32": "int32",
+    "sfixed64": "int64",
+    "sint32": "int32",
+    "sint64": "int64",
+}
+
+
+class _FieldHelpers(NamedTuple):
+    """Conversion helpers wrapping a field's values, or ``None`` for pass-through."""
+
+    to_proto: Optional[str]
+    from_proto: Optional[str]
+    key_to_proto: Optional[str]
+    key_from_proto: Optional[str]
+    value_to_proto: Optional[str]
+    value_from_proto: Optional[str]
+
+
+_NO_FIELD_HELPERS = _FieldHelpers(None, None, None, None, None, None)
+
+
+def _resolve_field_helpers(field: UEField) -> _FieldHelpers:
+    source = field.source
+    if source is None:
+        return _NO_FIELD_HELPERS
+    scalar = source.scalar if field.kind is model.FieldKind.SCALAR else None
+    key_scalar = value_scalar = None
+    entry = source.map_entry
+    if entry is not None:
+        if entry.key_kind is model.FieldKind.SCALAR:
+            key_scalar = entry.key_scalar
+        if entry.value_kind is model.FieldKind.SCALAR:
+            value_scalar = entry.value_scalar
+    return _FieldHelpers(
+        _TO_PROTO_SCALAR_HELPERS.get(scalar),
+        _FROM_PROTO_SCALAR_HELPERS.get(scalar),
+        _TO_PROTO_KEY_HELPERS.get(key_scalar),
+        _FROM_PROTO_KEY_HELPERS.get(key_scalar),
+        _TO_PROTO_SCALAR_HELPERS.get(value_scalar),
+        _FROM_PROTO_SCALAR_HELPERS.get(value_scalar),
+    )
+
+
+def _wrap_helper(helper: Optional[str], expr: str) -> str:
+    if helper is None:
+        return expr
+    return f"{helper}({expr})"
+
+
+_HEADER_SYSTEM_INCLUDES = """\
+#include "CoreMinimal.h"
+#include <string>
+#include <type_traits>
+#include <utility>
+#include "Kismet/BlueprintFunctionLibrary.h"
+"""
+
+_SOURCE_SYSTEM_INCLUDES = """\
+#include "google/protobuf/message.h"
+#include <string>
+#include <type_traits>
+#include <utility>
+
+
+"""
+
+# Private helpers emitted inside the converter class body. The string helpers
+# vary with the generator configuration; everything else is fixed.
+_INTERNAL_TRAIT_HELPERS = """\
+template <typename, typename = void>
+struct THasIsSet : std::false_type {};
+template <typename T>
+struct THasIsSet<T, std::void_t<decltype(std::declval<const T&>().IsSet())>> : std::true_type {};
+template <typename, typename = void>
+struct THasIsSetMember : std::false_type {};
+template <typename T>
+struct THasIsSetMember<T, std::void_t<decltype(std::declval<const T&>().bIsSet)>> : std::true_type {};
+template <typename, typename = void>
+struct THasNum : std::false_type {};
+template <typename T>
+struct THasNum<T, std::void_t<decltype(std::declval<const T&>().Num())>> : std::true_type {};
+template <typename, typename = void>
+struct THasEquality : std::false_type {};
+template <typename T>
+struct THasEquality<T, std::void_t<decltype(std::declval<const T&>() == std::declval<const T&>())>> : std::true_type {};
+template <typename, typename = void>
+struct THasGetValue : std::false_type {};
+template <typename T>
+struct THasGetValue<T, std::void_t<decltype(std::declval<const T&>().GetValue())>> : std::true_type {};
+template <typename, typename = void>
+struct THasValueMember : std::false_type {};
+template <typename T>
+struct THasValueMember<T, std::void_t<decltype(std::declval<const T&>().Value)>> : std::true_type {};
+template <typename T>
+static bool IsValueProvided(const T& Value) {
+    if constexpr (THasIsSet<T>::value) {
+        return Value.IsSet();
+    } else if constexpr (THasIsSetMember<T>::value) {
+        return Value.bIsSet;
+    } else if constexpr (THasNum<T>::value) {
+        return Value.Num() > 0;
+    } else if constexpr (std::is_pointer_v<T>) {
+        return Value != nullptr;
+    } else if constexpr (THasEquality<T>::value && std::is_default_constructible_v<T>) {
+        return Value != T{};
+    } else {
+        return false;
+    }
+}
+template <typename T>
+static decltype(auto) GetFieldValue(const T& Value) {
+    if constexpr (THasGetValue<T>::value) {
+        return Value.GetValue();
+    } else if constexpr (THasValueMember<T>::value) {
+        return Value.Value;
+    } else {
+        return Value;
+    }
+}"""
+
+# The default string helpers check for pure ASCII first (16 bytes at a time
+# with SSE2 where available) and then copy directly, only running the engine's
+# UTF-8 conversion for text that needs it.
+_ASCII_FAST_PATH_INCLUDES = """\
+#ifndef PROTO2UE_ASCII_SSE2
+#if PLATFORM_ENABLE_VECTORINTRINSICS && PLATFORM_CPU_X86_FAMILY
+#include <emmintrin.h>
+#define PROTO2UE_ASCII_SSE2 1
+#else
+#define PROTO2UE_ASCII_SSE2 0
+#endif
+#endif
+"""
+
+_TO_PROTO_STRING_HELPER = """\
+static bool IsAsciiText(const TCHAR* Data, int32 Length) {
+    int32 Index = 0;
+#if PROTO2UE_ASCII_SSE2
+    if constexpr (sizeof(TCHAR) == 2) {
+        const __m128i HighBits = _mm_set1_epi16(static_cast<short>(0xFF80));
+        const __m128i Zero = _mm_setzero_si128();
+        for (; Index + 8 <= Length; Index += 8) {
+            const __m128i Chunk = _mm_loadu_si128(reinterpret_cast<const __m128i*>(Data + Index));
+            if (_mm_movemask_epi8(_mm_cmpeq_epi16(_mm_and_si128(Chunk, HighBits), Zero)) != 0xFFFF) {
+                return false;
+            }
+        }
+    }
+#endif
+    for (; Index < Length; ++Index) {
+        if (static_cast<uint32>(Data[Index]) > 0x7F) {
+            return false;
+        }
+    }
+    return true;
+}
+static std::string ToProtoString(const FString& Value) {
+    const TCHAR* Data = *Value;
+    const int32 Length = Value.Len();
+    if (IsAsciiText(Data, Length)) {
+        std::string Result(static_cast<size_t>(Length), '\\0');
+        for (int32 Index = 0; Index < Length; ++Index) {
+            Result[Index] = static_cast<char>(Data[Index]);
+        }
+        return Result;
+    }
+    FTCHARToUTF8 Converter(Data, Length);
+    return std::string(Converter.Get(), Converter.Length());
+}"""
+
+_FROM_PROTO_STRING_HELPER = """\
+static bool IsAsciiText(const char* Data, size_t Length) {
+    size_t Index = 0;
+#if PROTO2UE_ASCII_SSE2
+    for (; Index + 16 <= Length; Index += 16) {
+        const __m128i Chunk = _mm_loadu_si128(reinterpret_cast<const __m128i*>(Data + Index));
+        if (_mm_movemask_epi8(Chunk) != 0) {
+            return false;
+        }
+    }
+#endif
+    for (; Index < Length; ++Index) {
+        if (static_cast<unsigned char>(Data[Index]) > 0x7F) {
+            return false;
+        }
+    }
+    return true;
+}
+static FString FromProtoString(const std::string& Value) {
+    if (Value.empty()) {
+        return FString();
+    }
+    if (IsAsciiText(Value.data(), Value.size())) {
+        const int32 Length = static_cast<int32>(Value.size());
+        FString Result;
+        TArray<TCHAR>& Chars = Result.GetCharArray();
+        Chars.SetNumUninitialized(Length + 1);
+        for (int32 Index = 0; Index < Length; ++Index) {
+            Chars[Index] = static_cast<TCHAR>(Value[Index]);
+        }
+        Chars[Length] = TEXT('\\0');
+        return Result;
+    }
+    // Convert the full length like the ASCII path so embedded NULs survive.
+    FUTF8ToTCHAR Converter(Value.data(), static_cast<int32>(Value.size()));
+    return FString(Converter.Length(), Converter.Get());
+}"""
+
+# simdutf variants size the output exactly before converting and fall back to
+# the engine conversion when the input is not valid UTF-16/UTF-8.
+_TO_PROTO_STRING_SIMDUTF_HELPER = """\
+static std::string ToProtoString(const FString& Value) {
+    static_assert(sizeof(TCHAR) == sizeof(char16_t), "simdutf conversion expects UTF-16 TCHAR");
+    const char16_t* Data = reinterpret_cast<const char16_t*>(*Value);
+    const size_t Length = static_cast<size_t>(Value.Len());
+    std::string Result(simdutf::utf8_length_from_utf16(Data, Length), '\\0');
+    const size_t Written = simdutf::convert_utf16_to_utf8(Data, Length, Result.data());
+    if (Written == 0 && Length != 0) {
+        FTCHARToUTF8 Converter(*Value, Value.Len());
+        return std::string(Converter.Get(), Converter.Length());
+    }
+    Result.resize(Written);
+    return Result;
+}"""
+
+_FROM_PROTO_STRING_SIMDUTF_HELPER = """\
+static FString FromProtoString(const std::string& Value) {
+    if (Value.empty()) {
+        return FString();
+    }
+    const size_t Length = simdutf::utf16_length_from_utf8(Value.data(), Value.size());
+    FString Result;
+    TArray<TCHAR>& Chars = Result.GetCharArray();
+    Chars.SetNumUninitialized(static_cast<int32>(Length) + 1);
+    const size_t Written = simdutf::convert_utf8_to_utf16(
+        Value.data(), Value.size(), reinterpret_cast<char16_t*>(Chars.GetData()));
+    if (Written == 0) {
+        FUTF8ToTCHAR Converter(Value.data(), static_cast<int32>(Value.size()));
+        return FString(Converter.Length(), Converter.Get());
+    }
+    Chars.SetNum(static_cast<int32>(Written) + 1);
+    Chars[static_cast<int32>(Written)] = TEXT('\\0');
+    return Result;
+}"""
+
+_TO_PROTO_BYTES_HELPER = """\
+static std::string ToProtoBytes(const TArray<uint8>& Value) {
+    return std::string(reinterpret_cast<const char*>(Value.GetData()), Value.Num());
+}
+static void ToProtoBytes(const TArray<uint8>& Value, std::string* Out) {
+    Out->assign(reinterpret_cast<const char*>(Value.GetData()), static_cast<size_t>(Value.Num()));
+}"""
+
+_FROM_PROTO_BYTES_HELPER = """\
+static TArray<uint8> FromProtoBytes(const std::string& Value) {
+    TArray<uint8> Result;
+    const int32 Length = static_cast<int32>(Value.size());
+    Result.SetNumUninitialized(Length);
+    if (Length > 0) {
+        FMemory::Memcpy(Result.GetData(), Value.data(), Length);
+    }
+    return Result;
+}"""
+
+
+@lru_cache(maxsize=None)
+def _internal_helpers_block(
+    to_proto_string: str, from_proto_string: str, include_traits: bool
+) -> str:
+    parts = [to_proto_string, _TO_PROTO_BYTES_HELPER, from_proto_string, _FROM_PROTO_BYTES_HELPER]
+    if include_traits:
+        parts.insert(0, _INTERNAL_TRAIT_HELPERS)
+    body = "\n".join(parts)
+    return "\n".join(f"    {line}" for line in body.split("\n"))
+
+
+# Group, field and package names recur across messages and files; these pure
+# helpers are memoised for the lifetime of the process.
+@lru_cache(maxsize=None)
+def _to_pascal_case(value: str) -> str:
+    parts = [part for part in value.split("_") if part]
+    return "".join(part[:1].upper() + part[1:] for part in parts) or value.title()
+
+
+@lru_cache(maxsize=None)
+def _format_proto_type_name(name: str) -> str:
+    stripped = name.lstrip(".")
+    if not stripped:
+        raise ValueError("Cannot qualify an empty proto type name")
+    return "::".join(stripped.split("."))
+
+
+_FieldShape = Tuple[bool, bool, bool, bool]
+_FieldEmitter = Callable[[UEField, str], str]
+
+
+def _field_shape(field: UEField) -> _FieldShape:
+    return (
+        field.is_map,
+        field.is_repeated,
+        field.kind is model.FieldKind.MESSAGE,
+        field.is_optional,
+    )
+
+
+def _has_presence_check(field: UEField) -> bool:
+    """Whether ToProto tests ``field`` through ``_provided_expr``."""
+
+    if field.source is None:
+        return False
+    if field.oneof_group:
+        return True
+    return field.is_optional and not field.is_map and not field.is_repeated
+
+
+def _shape_dispatch_table(
+    *,
+    map_: _FieldEmitter,
+    repeated_message: _FieldEmitter,
+    repeated_value: _FieldEmitter,
+    message: _FieldEmitter,
+    optional_message: _FieldEmitter,
+    value: _FieldEmitter,
+    optional_value: _FieldEmitter,
+) -> Dict[_FieldShape, _FieldEmitter]:
+    """Map every possible ``_field_shape`` result to the emitter handling it."""
+
+    table: Dict[_FieldShape, _FieldEmitter] = {}
+    for is_map, is_repeated, is_message, is_optional in product((False, True), repeat=4):
+        if is_map:
+            emitter = map_
+        elif is_repeated:
+            emitter = repeated_message if is_message else repeated_value
+        elif is_message:
+            emitter = optional_message if is_optional else message
+        else:
+            emitter = optional_value if is_optional else value
+        table[(is_map, is_repeated, is_message, is_optional)] = emitter
+    return table
 
 
 class ConvertersTemplate:
-    """Render conversion helpers for a UE proto file."""
+    """Render conversion helpers for a UE proto file.
 
-    def __init__(self, ue_file: UEProtoFile) -> None:
+    The template captures the file's messages and fields when it is
+    constructed, and :meth:`render` reuses its first result. Create a new
+    template after changing the file in place.
+    """
+
+    def __init__(self, ue_file: UEProtoFile, config: GeneratorConfig | None = None) -> None:
         self._ue_file = ue_file
+        self._config = config or GeneratorConfig()
+        self._rendered: Optional[ConverterRenderResult] = None
+        # Header and source both walk every message; flatten the tree once.
+        self._all_messages = self._collect_messages(ue_file.messages)
+        # Optional members normally go through their wrapper struct directly;
+        # the detection traits are only emitted when some field needs them.
+        needs_traits = self._config.legacy_traits or any(
+            field.optional_wrapper is None and _has_presence_check(field)
+            for message in self._all_messages
+            for field in message.fields
+        )
+        if self._config.use_simdutf:
+            self._internal_helpers = _internal_helpers_block(
+                _TO_PROTO_STRING_SIMDUTF_HELPER, _FROM_PROTO_STRING_SIMDUTF_HELPER, needs_traits
+            )
+        else:
+            self._internal_helpers = _internal_helpers_block(
+                _TO_PROTO_STRING_HELPER, _FROM_PROTO_STRING_HELPER, needs_traits
+            )
+        # Both ToProto and FromProto bodies walk each message's plain fields
+        # and oneof groups; split them once.
+        self._grouped_fields: Dict[
+            str, Tuple[List[UEField], Dict[str, List[UEField]]]
+        ] = {
+            message.full_name: self._group_fields(message.fields)
+            for message in self._all_messages
+        }
+        # Scalar helper choices are read several times per field while
+        # rendering; resolve them once, keyed by field identity.
+        self._field_helpers: Dict[int, _FieldHelpers] = {
+            id(field): _resolve_field_helpers(field)
+            for message in self._all_messages
+            for field in message.fields
+        }
+        # Both the header and the source name the converter class and include
+        # the dependency converters.
+        self._class_name = self._converter_class_name()
+        self._dependency_includes = self._dependency_converter_includes()
+        # Per-field emitters keyed by the field's shape, see ``_field_shape``.
+        self._to_proto_emitters = _shape_dispatch_table(
+            map_=self._emit_to_proto_map,
+            repeated_message=self._emit_to_proto_repeated_message,
+            repeated_value=self._emit_to_proto_repeated_value,
+            message=self._emit_to_proto_message,
+            optional_message=self._emit_to_proto_optional_message,
+            value=self._emit_to_proto_value,
+            optional_value=self._emit_to_proto_optional_value,
+        )
+        self._from_proto_emitters = _shape_dispatch_table(
+            map_=self._emit_from_proto_map,
+            repeated_message=self._emit_from_proto_repeated_message,
+            repeated_value=self._emit_from_proto_repeated_value,
+            message=self._emit_from_proto_message,
+            optional_message=self._emit_from_proto_optional_message,
+            value=self._emit_from_proto_value,
+            optional_value=self._emit_from_proto_optional_value,
+        )
 
     # Public API ---------------------------------------------------------
     def render(self) -> ConverterRenderResult:
-        return ConverterRenderResult(
-            header=self._render_header(),
-            source=self._render_source(),
-        )
+        if self._rendered is None:
+            self._rendered = ConverterRenderResult(
+                header=self._render_header(),
+                source=self._render_source(),
+            )
+        return self._rendered
 
-    def python_runtime(self) -> PythonConvertersRuntime:
+    def write(self, header: TextIO, source: TextIO) -> None:
+        """Stream the rendered header and source into ``header`` and ``source``."""
+
+        self._write_header(header.write)
+        self._write_source(source.write)
+
+    def python_runtime(self, *, validate_containers: bool = True) -> PythonConvertersRuntime:
         """Return a python runtime mirroring the generated logic for testing."""
 
-        return PythonConvertersRuntime(self._ue_file)
+        return PythonConvertersRuntime(
+            self._ue_file, validate_containers=validate_containers
+        )
 
     # Rendering helpers --------------------------------------------------
     def _render_header(self) -> str:
-        lines: List[str] = []
-        lines.append("#pragma once")
-        lines.append("")
-        lines.append(
-            f"// Generated conversion helpers by proto2ue. Source: {self._ue_file.name}"
-        )
-        lines.append("")
-        lines.append('#include "CoreMinimal.h"')
-        lines.append('#include <string>')
-        lines.append('#include <type_traits>')
-        lines.append('#include <utility>')
-        lines.append('#include "Kismet/BlueprintFunctionLibrary.h"')
-        header_include = self._generated_header_name()
-        lines.append(f'#include "{header_include}"')
-        proto_header_include = self._proto_message_header_name()
-        lines.append(f'#include "{proto_header_include}"')
-        for include in self._dependency_converter_includes():
-            lines.append(f'#include "{include}"')
-        generated_include = self._generated_converters_generated_header()
-        lines.append(f'#include "{generated_include}"')
-        lines.append("")
-        class_name = self._converter_class_name()
-        lines.append(f"class {class_name} {{")
-        lines.append("public:")
-        lines.append("    struct FConversionError { FString Message; FString FieldPath; };")
-        lines.append("    class FConversionContext {")
-        lines.append("    public:")
-        lines.append("        void AddError(const FString& InFieldPath, const FString& InMessage);")
-        lines.append("        bool HasErrors() const;")
-        lines.append("        const TArray<FConversionError>& GetErrors() const;")
-        lines.append("    private:")
-        lines.append("        TArray<FConversionError> Errors;")
-        lines.append("    };")
-        lines.append("")
-        for message in self._collect_messages(self._ue_file.messages):
+        buffer = io.StringIO()
+        self._write_header(buffer.write)
+        return buffer.getvalue()
+
+    def _write_header(self, write: Callable[[str], Any]) -> None:
+        write("#pragma once\n\n")
+        write(f"// Generated conversion helpers by proto2ue. Source: {self._ue_file.name}\n\n")
+        write(_HEADER_SYSTEM_INCLUDES)
+        if self._config.use_simdutf:
+            write('#include "simdutf.h"\n')
+        else:
+            write(_ASCII_FAST_PATH_INCLUDES)
+        write(f'#include "{self._generated_header_name()}"\n')
+        write(f'#include "{self._proto_message_header_name()}"\n')
+        for include in self._dependency_includes:
+            write(f'#include "{include}"\n')
+        write(f'#include "{self._generated_converters_generated_header()}"\n\n')
+        class_name = self._class_name
+        write(f"class {class_name} {{\npublic:\n")
+        write(_CONTEXT_DECLARATION)
+        write("\n\n")
+        for message in self._all_messages:
             ue_type = self._qualified_ue_type(message)
             proto_type = self._qualified_proto_type(message)
-            lines.append(
-                "    "
-                f"static void ToProto(const {ue_type}& Source, {proto_type}& Out, FConversionContext* Context = nullptr);"
-            )
-            lines.append(
-                "    "
-                f"static bool FromProto(const {proto_type}& Source, {ue_type}& Out, FConversionContext* Context = nullptr);"
-            )
-            lines.append("")
-        lines.append("private:")
-        lines.append("    friend class UProto2UEBlueprintLibrary;")
-        lines.append("")
-        lines.extend(self._render_internal_helpers(indent="    "))
-        lines.append("};")
-        lines.append("")
-        lines.append("UCLASS()")
-        lines.append(
-            "class UProto2UEBlueprintLibrary : public UBlueprintFunctionLibrary {"
-        )
-        lines.append("    GENERATED_BODY()")
-        lines.append("public:")
+            write(_CONVERTER_DECLARATIONS.substitute(ue_type=ue_type, proto_type=proto_type))
+        write("private:\n    friend class UProto2UEBlueprintLibrary;\n\n")
+        write(self._internal_helpers)
+        write("\n};\n\n")
+        write("UCLASS()\n")
+        write("class UProto2UEBlueprintLibrary : public UBlueprintFunctionLibrary {\n")
+        write("    GENERATED_BODY()\npublic:\n")
         for message in self._ue_file.messages:
             ue_type = self._qualified_ue_type(message)
-            proto_type = self._qualified_proto_type(message)
-            base_name = message.ue_name[1:] if message.ue_name.startswith("F") else message.ue_name
-            lines.append(
-                "    UFUNCTION(BlueprintCallable, Category=\"Proto2UE\")"
-            )
-            lines.append(
-                f"    static bool {base_name}ToProtoBytes(const {ue_type}& Source, TArray<uint8>& OutBytes, FString& Error);"
+            base_name = self._blueprint_base_name(message)
+            write(
+                "    UFUNCTION(BlueprintCallable, Category=\"Proto2UE\")\n"
+                f"    static bool {base_name}ToProtoBytes(const {ue_type}& Source, TArray<uint8>& OutBytes, FString& Error);\n"
+                "    UFUNCTION(BlueprintCallable, Category=\"Proto2UE\")\n"
+                f"    static bool {base_name}FromProtoBytes(const TArray<uint8>& InBytes, {ue_type}& OutData, FString& Error);\n"
             )
-            lines.append(
-                "    UFUNCTION(BlueprintCallable, Category=\"Proto2UE\")"
-            )
-            lines.append(
-                f"    static bool {base_name}FromProtoBytes(const TArray<uint8>& InBytes, {ue_type}& OutData, FString& Error);"
-            )
-        lines.append("};")
-        lines.append("")
-        return "\n".join(lines) + "\n"
+        write("};\n\n")
 
     def _render_source(self) -> str:
-        lines: List[str] = []
-        header_include = self._generated_converters_header()
-        lines.append(
-            f"// Generated conversion helpers by proto2ue. Source: {self._ue_file.name}"
-        )
-        lines.append(f'#include "{header_include}"')
-        for include in self._dependency_converter_includes():
-            lines.append(f'#include "{include}"')
-        lines.append("#include \"google/protobuf/message.h\"")
-        lines.append("#include <string>")
-        lines.append("#include <type_traits>")
-        lines.append("#include <utility>")
-        lines.append("")
-        class_name = self._converter_class_name()
-        lines.append("")
-        lines.append(
-            f"void {class_name}::FConversionContext::AddError(const FString& InFieldPath, const FString& InMessage) {{"
-        )
-        lines.append("    Errors.Emplace(FConversionError{InMessage, InFieldPath});")
-        lines.append("}")
-        lines.append(
-            f"bool {class_name}::FConversionContext::HasErrors() const {{ return Errors.Num() > 0; }}"
-        )
-        lines.append(
-            f"const TArray<{class_name}::FConversionError>& {class_name}::FConversionContext::GetErrors() const {{ return Errors; }}"
-        )
-        lines.append("")
-        for message in self._collect_messages(self._ue_file.messages):
+        buffer = io.StringIO()
+        self._write_source(buffer.write)
+        return buffer.getvalue()
+
+    def _write_source(self, write: Callable[[str], Any]) -> None:
+        write(f"// Generated conversion helpers by proto2ue. Source: {self._ue_file.name}\n")
+        write(f'#include "{self._generated_converters_header()}"\n')
+        for include in self._dependency_includes:
+            write(f'#include "{include}"\n')
+        write(_SOURCE_SYSTEM_INCLUDES)
+        class_name = self._class_name
+        write(_CONTEXT_DEFINITIONS.substitute(class_name=class_name))
+        write("\n\n")
+        for message in self._all_messages:
             ue_type = self._qualified_ue_type(message)
             proto_type = self._qualified_proto_type(message)
-            lines.extend(
-                self._render_to_proto_function(class_name, message, ue_type, proto_type)
-            )
-            lines.append("")
-            lines.extend(
-                self._render_from_proto_function(class_name, message, ue_type, proto_type)
-            )
-            lines.append("")
-        lines.append("namespace {")
-        lines.append(
-            f"FString FormatConversionErrors(const {class_name}::FConversionContext& Context) {{"
-        )
-        lines.append("    FString Combined;")
-        lines.append("    const auto& Errors = Context.GetErrors();")
-        lines.append("    for (const auto& ConversionError : Errors) {")
-        lines.append("        if (!Combined.IsEmpty()) {")
-        lines.append("            Combined += TEXT(\"; \");")
-        lines.append("        }")
-        lines.append("        if (!ConversionError.FieldPath.IsEmpty()) {")
-        lines.append("            Combined += ConversionError.FieldPath;")
-        lines.append("            Combined += TEXT(\": \");")
-        lines.append("        }")
-        lines.append("        Combined += ConversionError.Message;")
-        lines.append("    }")
-        lines.append("    if (Combined.IsEmpty()) {")
-        lines.append("        return FString(TEXT(\"Unknown conversion error.\"));")
-        lines.append("    }")
-        lines.append("    return Combined;")
-        lines.append("}")
-        lines.append("}  // namespace")
-        lines.append("")
+            self._write_to_proto_function(write, class_name, message, ue_type, proto_type)
+            write("\n\n")
+            self._write_from_proto_function(write, class_name, message, ue_type, proto_type)
+            write("\n\n")
+        write(_FORMAT_ERRORS_HELPER.substitute(class_name=class_name))
+        write("\n\n")
         for message in self._ue_file.messages:
-            ue_type = self._qualified_ue_type(message)
-            proto_type = self._qualified_proto_type(message)
-            base_name = message.ue_name[1:] if message.ue_name.startswith("F") else message.ue_name
-            lines.append(
-                f"bool UProto2UEBlueprintLibrary::{base_name}ToProtoBytes(const {ue_type}& Source, TArray<uint8>& OutBytes, FString& Error) {{"
-            )
-            lines.append(f"    {class_name}::FConversionContext Context;")
-            lines.append(f"    {proto_type} ProtoMessage;")
-            lines.append(f"    {class_name}::ToProto(Source, ProtoMessage, &Context);")
-            lines.append("    if (Context.HasErrors()) {")
-            lines.append("        Error = FormatConversionErrors(Context);")
-            lines.append("        return false;")
-            lines.append("    }")
-            lines.append("    std::string Serialized;")
-            lines.append("    if (!ProtoMessage.SerializeToString(&Serialized)) {")
-            lines.append(
-                "        Error = TEXT(\"Failed to serialize protobuf message.\");"
-            )
-            lines.append("        return false;")
-            lines.append("    }")
-            lines.append(f"    OutBytes = {class_name}::FromProtoBytes(Serialized);")
-            lines.append("    Error = FString();")
-            lines.append("    return true;")
-            lines.append("}")
-            lines.append("")
-            lines.append(
-                f"bool UProto2UEBlueprintLibrary::{base_name}FromProtoBytes(const TArray<uint8>& InBytes, {ue_type}& OutData, FString& Error) {{"
-            )
-            lines.append(
-                f"    const std::string Serialized = {class_name}::ToProtoBytes(InBytes);"
-            )
-            lines.append(f"    {proto_type} ProtoMessage;")
-            lines.append("    if (!ProtoMessage.ParseFromString(Serialized)) {")
-            lines.append(
-                "        Error = TEXT(\"Failed to parse protobuf bytes.\");"
+            base_name = self._blueprint_base_name(message)
+            write(
+                _BLUEPRINT_BYTES_FUNCTIONS.substitute(
+                    class_name=class_name,
+                    base_name=base_name,
+                    ue_type=self._qualified_ue_type(message),
+                    proto_type=self._qualified_proto_type(message),
+                )
             )
-            lines.append("        return false;")
-            lines.append("    }")
-            lines.append(f"    {class_name}::FConversionContext Context;")
-            lines.append(
-                f"    if (!{class_name}::FromProto(ProtoMessage, OutData, &Context)) {{"
+            write("\n\n")
+
+    def _group_fields(
+        self, fields: Iterable[UEField]
+    ) -> Tuple[List[UEField], Dict[str, List[UEField]]]:
+        plain: List[UEField] = []
+        groups: Dict[str, List[UEField]] = {}
+        for field in fields:
+            if field.oneof_group:
+                groups.setdefault(field.oneof_group, []).append(field)
+            elif field.source is not None:
+                plain.append(field)
+        return plain, groups
+
+    def _write_to_proto_function(
+        self,
+        write: Callable[[str], Any],
+        class_name: str,
+        message: UEMessage,
+        ue_type: str,
+        proto_type: str,
+    ) -> None:
+        # Each field contributes one preformatted block, written out as soon as
+        # it has been emitted.
+        write(
+            _TO_PROTO_FUNCTION_OPEN.substitute(
+                class_name=class_name, ue_type=ue_type, proto_type=proto_type
             )
-            lines.append("        Error = FormatConversionErrors(Context);")
-            lines.append("        return false;")
-            lines.append("    }")
-            lines.append("    Error = FString();")
-            lines.append("    return true;")
-            lines.append("}")
-            lines.append("")
-        return "\n".join(lines) + "\n"
-
-    def _render_internal_helpers(self, *, indent: str) -> List[str]:
-        lines: List[str] = []
-        pad = indent
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasIsSet : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasIsSet<T, std::void_t<decltype(std::declval<const T&>().IsSet())>> : std::true_type {{}};"
-        )
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasIsSetMember : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasIsSetMember<T, std::void_t<decltype(std::declval<const T&>().bIsSet)>> : std::true_type {{}};"
         )
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasNum : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasNum<T, std::void_t<decltype(std::declval<const T&>().Num())>> : std::true_type {{}};"
-        )
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasEquality : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasEquality<T, std::void_t<decltype(std::declval<const T&>() == std::declval<const T&>())>> : std::true_type {{}};"
-        )
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasGetValue : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasGetValue<T, std::void_t<decltype(std::declval<const T&>().GetValue())>> : std::true_type {{}};"
+        plain_fields, oneof_groups = self._grouped_fields[message.full_name]
+        for group_name, group_fields in oneof_groups.items():
+            if group_fields:
+                write(self._render_to_proto_oneof_group(group_name, group_fields))
+                write("\n")
+        emitters = self._to_proto_emitters
+        for field in plain_fields:
+            write(emitters[_field_shape(field)](field, field.source.name))
+            write("\n")
+        write("}")
+
+    def _emit_to_proto_map(self, field: UEField, field_name: str) -> str:
+        map_entry = field.source.map_entry
+        if map_entry is None:
+            raise ValueError("Map field is missing map entry metadata")
+        map_container = f"ProtoMap_{field.name}"
+        key_line, key_expr = self._map_key_binding(
+            "Kvp.Key", self._to_proto_map_key(field, "Kvp.Key"), f"ProtoKey_{field.name}"
         )
-        lines.append(f"{pad}template <typename, typename = void>")
-        lines.append(f"{pad}struct THasValueMember : std::false_type {{}};")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(
-            f"{pad}struct THasValueMember<T, std::void_t<decltype(std::declval<const T&>().Value)>> : std::true_type {{}};"
+        if map_entry.value_kind is model.FieldKind.MESSAGE:
+            body = (
+                f"        auto& Added = {map_container}[{key_expr}];\n"
+                "        ToProto(Kvp.Value, Added, Context);\n"
+            )
+        elif self._field_helpers[id(field)].value_to_proto == "ToProtoBytes":
+            body = f"        ToProtoBytes(Kvp.Value, &{map_container}[{key_expr}]);\n"
+        else:
+            value_expr = "Kvp.Value"
+            if map_entry.value_kind is model.FieldKind.ENUM:
+                enum_type = self._qualified_proto_map_value_enum_type(field)
+                value_expr = f"static_cast<{enum_type}>({value_expr})"
+            else:
+                value_expr = self._to_proto_map_value(field, value_expr)
+            body = f"        {map_container}[{key_expr}] = {value_expr};\n"
+        return (
+            f"    auto& {map_container} = *Out.mutable_{field_name}();\n"
+            f"    for (const auto& Kvp : Source.{field.name}) {{\n"
+            f"{key_line}{body}"
+            "    }"
         )
-        lines.append(f"{pad}template <typename T>")
-        lines.append(f"{pad}static bool IsValueProvided(const T& Value) {{")
-        lines.append(f"{pad}    if constexpr (THasIsSet<T>::value) {{")
-        lines.append(f"{pad}        return Value.IsSet();")
-        lines.append(f"{pad}    }} else if constexpr (THasIsSetMember<T>::value) {{")
-        lines.append(f"{pad}        return Value.bIsSet;")
-        lines.append(f"{pad}    }} else if constexpr (THasNum<T>::value) {{")
-        lines.append(f"{pad}        return Value.Num() > 0;")
-        lines.append(f"{pad}    }} else if constexpr (std::is_pointer_v<T>) {{")
-        lines.append(f"{pad}        return Value != nullptr;")
-        lines.append(
-            f"{pad}    }} else if constexpr (THasEquality<T>::value && std::is_default_constructible_v<T>) {{"
+
+    def _map_key_binding(
+        self, key_expr: str, converted_expr: str, local_name: str
+    ) -> Tuple[str, str]:
+        # Keys that need converting are bound to a local once per entry.
+        if converted_expr == key_expr:
+            return "", key_expr
+        return f"        const auto {local_name} = {converted_expr};\n", local_name
+
+    def _emit_to_proto_repeated_message(self, field: UEField, field_name: str) -> str:
+        return (
+            f"    for (const auto& Item : Source.{field.name}) {{\n"
+            f"        auto* Added = Out.add_{field_name}();\n"
+            "        ToProto(Item, *Added, Context);\n"
+            "    }"
         )
-        lines.append(f"{pad}        return Value != T{{}};")
-        lines.append(f"{pad}    }} else {{")
-        lines.append(f"{pad}        return false;")
-        lines.append(f"{pad}    }}")
-        lines.append(f"{pad}}}")
-        lines.append(f"{pad}template <typename T>")
-        lines.append(f"{pad}static decltype(auto) GetFieldValue(const T& Value) {{")
-        lines.append(f"{pad}    if constexpr (THasGetValue<T>::value) {{")
-        lines.append(f"{pad}        return Value.GetValue();")
-        lines.append(f"{pad}    }} else if constexpr (THasValueMember<T>::value) {{")
-        lines.append(f"{pad}        return Value.Value;")
-        lines.append(f"{pad}    }} else {{")
-        lines.append(f"{pad}        return Value;")
-        lines.append(f"{pad}    }}")
-        lines.append(f"{pad}}}")
-        lines.append(f"{pad}static std::string ToProtoString(const FString& Value) {{")
-        lines.append(f"{pad}    FTCHARToUTF8 Converter(*Value);")
-        lines.append(f"{pad}    return std::string(Converter.Get(), Converter.Length());")
-        lines.append(f"{pad}}}")
-        lines.append(f"{pad}static std::string ToProtoBytes(const TArray<uint8>& Value) {{")
-        lines.append(
-            f"{pad}    return std::string(reinterpret_cast<const char*>(Value.GetData()), Value.Num());"
+
+    def _emit_to_proto_repeated_value(self, field: UEField, field_name: str) -> str:
+        if self._is_bulk_copyable(field):
+            return (
+                f"    Out.mutable_{field_name}()->Add(Source.{field.name}.GetData(), "
+                f"Source.{field.name}.GetData() + Source.{field.name}.Num());"
+            )
+        if self._is_bytes_field(field):
+            store = f"ToProtoBytes(Item, Out.add_{field_name}());"
+        else:
+            store = f"Out.add_{field_name}({self._to_proto_field_value(field, 'Item')});"
+        return f"    for (const auto& Item : Source.{field.name}) {{ {store} }}"
+
+    def _emit_to_proto_message(self, field: UEField, field_name: str) -> str:
+        return f"    ToProto(Source.{field.name}, *Out.mutable_{field_name}(), Context);"
+
+    def _emit_to_proto_optional_message(self, field: UEField, field_name: str) -> str:
+        return (
+            f"    if ({self._provided_expr(field)}) {{\n"
+            f"        ToProto({self._provided_value_expr(field)}, *Out.mutable_{field_name}(), Context);\n"
+            "    }"
         )
-        lines.append(f"{pad}}}")
-        lines.append(f"{pad}static FString FromProtoString(const std::string& Value) {{")
-        lines.append(f"{pad}    return FString(UTF8_TO_TCHAR(Value.c_str()));")
-        lines.append(f"{pad}}}")
-        lines.append(f"{pad}static TArray<uint8> FromProtoBytes(const std::string& Value) {{")
-        lines.append(f"{pad}    TArray<uint8> Result;")
-        lines.append(
-            f"{pad}    Result.Append(reinterpret_cast<const uint8*>(Value.data()), Value.size());"
+
+    def _emit_to_proto_value(self, field: UEField, field_name: str) -> str:
+        store = self._to_proto_store(field, field_name, f"Source.{field.name}")
+        return f"    if (true) {{ {store} }}"
+
+    def _emit_to_proto_optional_value(self, field: UEField, field_name: str) -> str:
+        store = self._to_proto_store(
+            field, field_name, self._provided_value_expr(field)
         )
-        lines.append(f"{pad}    return Result;")
-        lines.append(f"{pad}}}")
-        return lines
+        return f"    if ({self._provided_expr(field)}) {{ {store} }}"
 
-    def _group_oneof_fields(self, fields: Iterable[UEField]) -> Dict[str, List[UEField]]:
-        groups: Dict[str, List[UEField]] = {}
-        for field in fields:
-            if field.oneof_group:
-                groups.setdefault(field.oneof_group, []).append(field)
-        return groups
-
-    def _render_to_proto_function(
-        self, class_name: str, message: UEMessage, ue_type: str, proto_type: str
-    ) -> List[str]:
-        lines: List[str] = []
-        lines.append(
-            f"void {class_name}::ToProto(const {ue_type}& Source, {proto_type}& Out, FConversionContext* Context) {{"
+    def _provided_expr(self, field: UEField) -> str:
+        wrapper = field.optional_wrapper
+        if wrapper is None or self._config.legacy_traits:
+            return f"IsValueProvided(Source.{field.name})"
+        return f"Source.{field.name}.{wrapper.is_set_member}"
+
+    def _provided_value_expr(self, field: UEField) -> str:
+        wrapper = field.optional_wrapper
+        if wrapper is None or self._config.legacy_traits:
+            return f"GetFieldValue(Source.{field.name})"
+        return f"Source.{field.name}.{wrapper.value_member}"
+
+    def _to_proto_store(self, field: UEField, field_name: str, value_expr: str) -> str:
+        if self._is_bytes_field(field):
+            # Copy straight into the message-owned string rather than through
+            # a temporary std::string.
+            return f"ToProtoBytes({value_expr}, Out.mutable_{field_name}());"
+        return f"Out.set_{field_name}({self._to_proto_field_value(field, value_expr)});"
+
+    def _is_bulk_copyable(self, field: UEField) -> bool:
+        # Numeric and bool elements whose UE type is the plain counterpart of
+        # the proto type share their layout and can be copied in one go.
+        return (
+            field.kind is model.FieldKind.SCALAR
+            and field.container == "TArray"
+            and _BULK_COPY_SCALARS.get(field.source.scalar) == field.base_type
         )
-        lines.append("    Out.Clear();")
-        oneof_groups = self._group_oneof_fields(message.fields)
-        for group_name, group_fields in oneof_groups.items():
-            lines.extend(self._render_to_proto_oneof_group(group_name, group_fields))
-        for field in message.fields:
-            source = field.source
-            if source is None:
-                continue
-            if field.oneof_group:
-                continue
-            field_name = source.name
-            if field.is_map:
-                map_entry = field.source.map_entry
-                if map_entry is None:
-                    raise ValueError("Map field is missing map entry metadata")
-                map_container = f"ProtoMap_{field.name}"
-                lines.append(
-                    f"    auto& {map_container} = *Out.mutable_{field_name}();"
-                )
-                if map_entry.value_kind is model.FieldKind.MESSAGE:
-                    lines.append(
-                        f"    for (const auto& Kvp : Source.{field.name}) {{"
-                    )
-                    key_expr = "Kvp.Key"
-                    proto_key_expr = self._to_proto_map_key(field, key_expr)
-                    if proto_key_expr != key_expr:
-                        key_var = f"ProtoKey_{field.name}"
-                        lines.append(
-                            f"        const auto {key_var} = {proto_key_expr};"
-                        )
-                        key_expr = key_var
-                    lines.append(
-                        f"        auto& Added = {map_container}[{key_expr}];"
-                    )
-                    lines.append("        ToProto(Kvp.Value, Added, Context);")
-                    lines.append("    }")
-                else:
-                    lines.append(
-                        f"    for (const auto& Kvp : Source.{field.name}) {{"
-                    )
-                    key_expr = "Kvp.Key"
-                    proto_key_expr = self._to_proto_map_key(field, key_expr)
-                    if proto_key_expr != key_expr:
-                        key_var = f"ProtoKey_{field.name}"
-                        lines.append(
-                            f"        const auto {key_var} = {proto_key_expr};"
-                        )
-                        key_expr = key_var
-                    value_expr = "Kvp.Value"
-                    if map_entry.value_kind is model.FieldKind.ENUM:
-                        proto_type = self._qualified_proto_map_value_enum_type(field)
-                        value_expr = f"static_cast<{proto_type}>({value_expr})"
-                    else:
-                        value_expr = self._to_proto_map_value(field, value_expr)
-                    lines.append(
-                        f"        {map_container}[{key_expr}] = {value_expr};"
-                    )
-                    lines.append("    }")
-            elif field.is_repeated:
-                if field.kind is model.FieldKind.MESSAGE:
-                    lines.append(
-                        f"    for (const auto& Item : Source.{field.name}) {{"
-                    )
-                    lines.append(
-                        f"        auto* Added = Out.add_{field_name}();"
-                    )
-                    lines.append("        ToProto(Item, *Added, Context);")
-                    lines.append("    }")
-                else:
-                    item_expr = "Item"
-                    if field.kind is model.FieldKind.ENUM:
-                        proto_type = self._qualified_proto_enum_type(field)
-                        item_expr = f"static_cast<{proto_type}>(Item)"
-                    else:
-                        item_expr = self._to_proto_value(field, item_expr)
-                    lines.append(
-                        f"    for (const auto& Item : Source.{field.name}) {{ Out.add_{field_name}({item_expr}); }}"
-                    )
-            elif field.kind is model.FieldKind.MESSAGE:
-                if field.is_optional:
-                    lines.append(
-                        f"    if (IsValueProvided(Source.{field.name})) {{"
-                    )
-                    lines.append(
-                        f"        ToProto(GetFieldValue(Source.{field.name}), *Out.mutable_{field_name}(), Context);"
-                    )
-                    lines.append("    }")
-                else:
-                    lines.append(
-                        f"    ToProto(Source.{field.name}, *Out.mutable_{field_name}(), Context);"
-                    )
-            else:
-                if field.is_optional:
-                    condition = f"IsValueProvided(Source.{field.name})"
-                    value_expr = f"GetFieldValue(Source.{field.name})"
-                else:
-                    condition = "true"
-                    value_expr = f"Source.{field.name}"
-                if field.kind is model.FieldKind.ENUM:
-                    proto_type = self._qualified_proto_enum_type(field)
-                    value_expr = f"static_cast<{proto_type}>({value_expr})"
-                else:
-                    value_expr = self._to_proto_value(field, value_expr)
-                assignment = f"Out.set_{field_name}({value_expr});"
-                lines.append(f"    if ({condition}) {{ {assignment} }}")
-        lines.append("}")
-        return lines
 
-    def _render_to_proto_oneof_group(
-        self, group_name: str, fields: List[UEField]
-    ) -> List[str]:
-        if not fields:
-            return []
-        lines: List[str] = []
-        guard_var = f"bHas{self._to_pascal_case(group_name)}Value"
-        lines.append("    {")
-        lines.append(f"        bool {guard_var} = false;")
-        lines.append(f"        const TCHAR* FieldPath = TEXT(\"{group_name}\");")
-        for field in fields:
-            source = field.source
-            if source is None:
-                continue
-            field_name = source.name
-            lines.append(
-                f"        if (IsValueProvided(Source.{field.name})) {{"
+    def _is_bytes_field(self, field: UEField) -> bool:
+        return self._field_helpers[id(field)].to_proto == "ToProtoBytes"
+
+    def _to_proto_field_value(self, field: UEField, value_expr: str) -> str:
+        if field.kind is model.FieldKind.ENUM:
+            enum_type = self._qualified_proto_enum_type(field)
+            return f"static_cast<{enum_type}>({value_expr})"
+        return self._to_proto_value(field, value_expr)
+
+    def _render_to_proto_oneof_group(self, group_name: str, fields: List[UEField]) -> str:
+        # The UE struct carries no case discriminator, so each member's
+        # presence is tested exactly once; the first provided member is encoded
+        # through a single if/else chain and extra members are reported.
+        # Flags are numbered by position; names derived from the field could
+        # collide (``value`` and ``Value`` both PascalCase to ``Value``).
+        members = [
+            (field, field.source.name, f"bHasCase{index}")
+            for index, field in enumerate(
+                field for field in fields if field.source is not None
             )
-            lines.append(f"            if ({guard_var}) {{")
-            lines.append("                if (Context) {")
-            lines.append(
-                "                    Context->AddError(FieldPath, TEXT(\"Multiple values provided for oneof\"));"
+        ]
+        blocks: List[str] = ["    {"]
+        for field, _, flag in members:
+            blocks.append(f"        const bool {flag} = {self._provided_expr(field)};")
+        if len(members) > 1:
+            provided_count = " + ".join(f"static_cast<int32>({flag})" for _, _, flag in members)
+            blocks.append(
+                f"        if (Context && {provided_count} > 1) {{\n"
+                f"            Context->AddError(TEXT(\"{group_name}\"), TEXT(\"Multiple values provided for oneof\"));\n"
+                "        }"
             )
-            lines.append("                }")
-            lines.append("                continue;")
-            lines.append("            }")
-            lines.append(f"            {guard_var} = true;")
-            lines.extend(
-                self._render_to_proto_oneof_assignment(field, field_name, indent="            ")
+        for index, (field, field_name, flag) in enumerate(members):
+            branch = "if" if index == 0 else "} else if"
+            blocks.append(
+                f"        {branch} ({flag}) {{\n"
+                f"{self._render_to_proto_oneof_assignment(field, field_name, indent='            ')}"
             )
-            lines.append("        }")
-        lines.append("    }")
-        return lines
+        if members:
+            blocks.append("        }")
+        blocks.append("    }")
+        return "\n".join(blocks)
 
     def _render_to_proto_oneof_assignment(
         self, field: UEField, field_name: str, *, indent: str
-    ) -> List[str]:
-        value_expr = f"GetFieldValue(Source.{field.name})"
-        lines = [f"{indent}const auto& ActiveValue = {value_expr};"]
+    ) -> str:
+        head = f"{indent}const auto& ActiveValue = {self._provided_value_expr(field)};\n"
         if field.kind is model.FieldKind.MESSAGE:
-            lines.append(
-                f"{indent}ToProto(ActiveValue, *Out.mutable_{field_name}(), Context);"
+            return f"{head}{indent}ToProto(ActiveValue, *Out.mutable_{field_name}(), Context);"
+        return f"{head}{indent}{self._to_proto_store(field, field_name, 'ActiveValue')}"
+
+    def _write_from_proto_function(
+        self,
+        write: Callable[[str], Any],
+        class_name: str,
+        message: UEMessage,
+        ue_type: str,
+        proto_type: str,
+    ) -> None:
+        write(
+            _FROM_PROTO_FUNCTION_OPEN.substitute(
+                class_name=class_name, ue_type=ue_type, proto_type=proto_type
+            )
+        )
+        plain_fields, oneof_groups = self._grouped_fields[message.full_name]
+        for group_name, group_fields in oneof_groups.items():
+            if group_fields:
+                write(self._render_from_proto_oneof_group(proto_type, group_name, group_fields))
+                write("\n")
+        emitters = self._from_proto_emitters
+        for field in plain_fields:
+            write(emitters[_field_shape(field)](field, field.source.name))
+            write("\n")
+        write(_FROM_PROTO_FUNCTION_CLOSE)
+
+    def _emit_from_proto_map(self, field: UEField, field_name: str) -> str:
+        map_entry = field.source.map_entry
+        if map_entry is None:
+            raise ValueError("Map field is missing map entry metadata")
+        key_line, key_expr = self._map_key_binding(
+            "Kvp.first", self._from_proto_map_key(field, "Kvp.first"), f"Key_{field.name}"
+        )
+        if map_entry.value_kind is model.FieldKind.MESSAGE:
+            # Decode into the map-owned slot; FromProto resets it first.
+            body = (
+                f"        auto& Value = Out.{field.name}.Emplace({key_expr});\n"
+                "        bOk = FromProto(Kvp.second, Value, Context) && bOk;\n"
             )
         else:
-            value_expr = "ActiveValue"
-            if field.kind is model.FieldKind.ENUM:
-                proto_type = self._qualified_proto_enum_type(field)
-                value_expr = f"static_cast<{proto_type}>({value_expr})"
+            value_expr = "Kvp.second"
+            if map_entry.value_kind is model.FieldKind.ENUM:
+                value_type = field.map_value_type or "auto"
+                value_expr = f"static_cast<{value_type}>({value_expr})"
             else:
-                value_expr = self._to_proto_value(field, value_expr)
-            lines.append(f"{indent}Out.set_{field_name}({value_expr});")
-        return lines
+                value_expr = self._from_proto_map_value(field, value_expr)
+            body = f"        Out.{field.name}.Add({key_expr}, {value_expr});\n"
+        return (
+            f"{self._from_proto_reserve(field, field_name)}\n"
+            f"    for (const auto& Kvp : Source.{field_name}()) {{\n"
+            f"{key_line}{body}"
+            "    }"
+        )
 
-    def _render_from_proto_function(
-        self, class_name: str, message: UEMessage, ue_type: str, proto_type: str
-    ) -> List[str]:
-        lines: List[str] = []
-        lines.append(
-            f"bool {class_name}::FromProto(const {proto_type}& Source, {ue_type}& Out, FConversionContext* Context) {{"
+    def _emit_from_proto_repeated_message(self, field: UEField, field_name: str) -> str:
+        return (
+            f"{self._from_proto_reserve(field, field_name)}\n"
+            f"    for (const auto& Item : Source.{field_name}()) {{\n"
+            f"        auto& Added = Out.{field.name}.Emplace_GetRef();\n"
+            "        bOk = FromProto(Item, Added, Context) && bOk;\n"
+            "    }"
         )
-        lines.append("    Out = {};")
-        lines.append("    bool bOk = true;")
-        oneof_groups = self._group_oneof_fields(message.fields)
-        for group_name, group_fields in oneof_groups.items():
-            lines.extend(
-                self._render_from_proto_oneof_group(proto_type, group_name, group_fields)
+
+    def _emit_from_proto_repeated_value(self, field: UEField, field_name: str) -> str:
+        if self._is_bulk_copyable(field):
+            element = field.base_type
+            return (
+                "    {\n"
+                f"        const auto& Items = Source.{field_name}();\n"
+                f"        static_assert(sizeof({element}) == sizeof(*Items.data()), "
+                "\"Repeated scalar layout mismatch\");\n"
+                "        const int32 Count = Items.size();\n"
+                f"        Out.{field.name}.SetNumUninitialized(Count);\n"
+                "        if (Count > 0) {\n"
+                f"            FMemory::Memcpy(Out.{field.name}.GetData(), Items.data(), sizeof({element}) * Count);\n"
+                "        }\n"
+                "    }"
             )
-        for field in message.fields:
-            source = field.source
-            if source is None:
-                continue
-            if field.oneof_group:
-                continue
-            field_name = source.name
-            if field.is_map:
-                map_entry = field.source.map_entry
-                if map_entry is None:
-                    raise ValueError("Map field is missing map entry metadata")
-                lines.append(
-                    f"    for (const auto& Kvp : Source.{field_name}()) {{"
-                )
-                key_expr = "Kvp.first"
-                proto_key_expr = self._from_proto_map_key(field, key_expr)
-                if proto_key_expr != key_expr:
-                    key_var = f"Key_{field.name}"
-                    lines.append(
-                        f"        const auto {key_var} = {proto_key_expr};"
-                    )
-                    key_expr = key_var
-                if map_entry.value_kind is model.FieldKind.MESSAGE:
-                    value_type = field.map_value_type or "auto"
-                    lines.append(
-                        f"        {value_type} Value;"
-                    )
-                    lines.append(
-                        "        bOk = FromProto(Kvp.second, Value, Context) && bOk;"
-                    )
-                    lines.append(
-                        f"        Out.{field.name}.Add({key_expr}, Value);"
-                    )
-                else:
-                    value_expr = "Kvp.second"
-                    if map_entry.value_kind is model.FieldKind.ENUM:
-                        value_type = field.map_value_type or "auto"
-                        value_expr = f"static_cast<{value_type}>({value_expr})"
-                    else:
-                        value_expr = self._from_proto_map_value(field, value_expr)
-                    lines.append(
-                        f"        Out.{field.name}.Add({key_expr}, {value_expr});"
-                    )
-                lines.append("    }")
-            elif field.is_repeated:
-                if field.kind is model.FieldKind.MESSAGE:
-                    lines.append(
-                        f"    for (const auto& Item : Source.{field_name}()) {{"
-                    )
-                    lines.append(
-                        f"        auto& Added = Out.{field.name}.Emplace_GetRef();"
-                    )
-                    lines.append(
-                        "        bOk = FromProto(Item, Added, Context) && bOk;"
-                    )
-                    lines.append("    }")
-                else:
-                    item_expr = "Item"
-                    if field.kind is model.FieldKind.ENUM:
-                        item_expr = f"static_cast<{field.base_type}>(Item)"
-                    else:
-                        item_expr = self._from_proto_value(field, item_expr)
-                    lines.append(
-                        f"    for (const auto& Item : Source.{field_name}()) {{ Out.{field.name}.Add({item_expr}); }}"
-                    )
-            elif field.kind is model.FieldKind.MESSAGE:
-                if field.is_optional:
-                    lines.append(
-                        f"    if (Source.has_{field_name}()) {{"
-                    )
-                    wrapper = field.optional_wrapper
-                    if wrapper is None:
-                        lines.append(
-                            f"        auto& Dest = Out.{field.name}.Emplace();"
-                        )
-                        lines.append(
-                            "        bOk = FromProto(Source.{field_name}(), Dest, Context) && bOk;"
-                        )
-                    else:
-                        value_member = wrapper.value_member
-                        is_set_member = wrapper.is_set_member
-                        lines.append(
-                            f"        auto& Dest = Out.{field.name}.{value_member};"
-                        )
-                        lines.append("        Dest = {};")
-                        lines.append(
-                            f"        Out.{field.name}.{is_set_member} = true;"
-                        )
-                        lines.append(
-                            "        bOk = FromProto(Source.{field_name}(), Dest, Context) && bOk;"
-                        )
-                    lines.append("    }")
-                else:
-                    lines.append(
-                        f"    bOk = FromProto(Source.{field_name}(), Out.{field.name}, Context) && bOk;"
-                    )
-            else:
-                if field.is_optional:
-                    value_expr = f"Source.{field_name}()"
-                    if field.kind is model.FieldKind.ENUM:
-                        value_expr = f"static_cast<{field.base_type}>({value_expr})"
-                    else:
-                        value_expr = self._from_proto_value(field, value_expr)
-                    wrapper = field.optional_wrapper
-                    if wrapper is None:
-                        lines.append(
-                            f"    if (Source.has_{field_name}()) {{ Out.{field.name} = {value_expr}; }}"
-                        )
-                    else:
-                        lines.append(
-                            f"    if (Source.has_{field_name}()) {{"
-                        )
-                        lines.append(
-                            f"        Out.{field.name}.{wrapper.value_member} = {value_expr};"
-                        )
-                        lines.append(
-                            f"        Out.{field.name}.{wrapper.is_set_member} = true;"
-                        )
-                        lines.append("    }")
-                else:
-                    value_expr = f"Source.{field_name}()"
-                    if field.kind is model.FieldKind.ENUM:
-                        value_expr = f"static_cast<{field.base_type}>({value_expr})"
-                    else:
-                        value_expr = self._from_proto_value(field, value_expr)
-                    lines.append(f"    Out.{field.name} = {value_expr};")
-        lines.append("    return bOk && (!Context || !Context->HasErrors());")
-        lines.append("}")
-        return lines
+        item_expr = self._from_proto_field_value(field, "Item")
+        return (
+            f"{self._from_proto_reserve(field, field_name)}\n"
+            f"    for (const auto& Item : Source.{field_name}()) {{ Out.{field.name}.Add({item_expr}); }}"
+        )
+
+    def _from_proto_reserve(self, field: UEField, field_name: str) -> str:
+        # Size the destination once instead of growing it per element.
+        return f"    Out.{field.name}.Reserve(static_cast<int32>(Source.{field_name}().size()));"
+
+    def _emit_from_proto_message(self, field: UEField, field_name: str) -> str:
+        return f"    bOk = FromProto(Source.{field_name}(), Out.{field.name}, Context) && bOk;"
+
+    def _emit_from_proto_optional_message(self, field: UEField, field_name: str) -> str:
+        return (
+            f"    if (Source.has_{field_name}()) {{\n"
+            f"{self._from_proto_optional_message_body(field, field_name, '        ')}\n"
+            "    }"
+        )
+
+    def _emit_from_proto_value(self, field: UEField, field_name: str) -> str:
+        value_expr = self._from_proto_field_value(field, f"Source.{field_name}()")
+        return f"    Out.{field.name} = {value_expr};"
+
+    def _emit_from_proto_optional_value(self, field: UEField, field_name: str) -> str:
+        value_expr = self._from_proto_field_value(field, f"Source.{field_name}()")
+        wrapper = field.optional_wrapper
+        if wrapper is None:
+            return f"    if (Source.has_{field_name}()) {{ Out.{field.name} = {value_expr}; }}"
+        return (
+            f"    if (Source.has_{field_name}()) {{\n"
+            f"        Out.{field.name}.{wrapper.value_member} = {value_expr};\n"
+            f"        Out.{field.name}.{wrapper.is_set_member} = true;\n"
+            "    }"
+        )
+
+    def _from_proto_field_value(self, field: UEField, value_expr: str) -> str:
+        if field.kind is model.FieldKind.ENUM:
+            return f"static_cast<{field.base_type}>({value_expr})"
+        return self._from_proto_value(field, value_expr)
+
+    def _from_proto_optional_message_body(
+        self, field: UEField, field_name: str, indent: str
+    ) -> str:
+        wrapper = field.optional_wrapper
+        if wrapper is None:
+            dest = f"{indent}auto& Dest = Out.{field.name}.Emplace();\n"
+        else:
+            dest = (
+                f"{indent}auto& Dest = Out.{field.name}.{wrapper.value_member};\n"
+                f"{indent}Dest = {{}};\n"
+                f"{indent}Out.{field.name}.{wrapper.is_set_member} = true;\n"
+            )
+        return f"{dest}{indent}bOk = FromProto(Source.{field_name}(), Dest, Context) && bOk;"
 
     def _render_from_proto_oneof_group(
         self, proto_type: str, group_name: str, fields: List[UEField]
-    ) -> List[str]:
-        if not fields:
-            return []
-        lines: List[str] = []
-        lines.append("    {")
-        case_enum = f"{proto_type}::{self._to_pascal_case(group_name)}Case"
-        lines.append(f"        const auto ActiveCase = Source.{group_name}_case();")
-        lines.append("        switch (ActiveCase) {")
+    ) -> str:
+        case_enum = f"{proto_type}::{_to_pascal_case(group_name)}Case"
+        blocks: List[str] = [
+            "    {\n"
+            f"        const auto ActiveCase = Source.{group_name}_case();\n"
+            "        switch (ActiveCase) {"
+        ]
         for field in fields:
             source = field.source
             if source is None:
                 continue
             field_name = source.name
-            case_name = f"{case_enum}::k{self._to_pascal_case(field_name)}"
-            lines.append(f"        case {case_name}: {{")
+            case_name = f"{case_enum}::k{_to_pascal_case(field_name)}"
             if field.kind is model.FieldKind.MESSAGE:
                 if field.is_optional:
-                    wrapper = field.optional_wrapper
-                    if wrapper is None:
-                        lines.append(
-                            f"            auto& Dest = Out.{field.name}.Emplace();"
-                        )
-                        lines.append(
-                            f"            bOk = FromProto(Source.{field_name}(), Dest, Context) && bOk;"
-                        )
-                    else:
-                        value_member = wrapper.value_member
-                        is_set_member = wrapper.is_set_member
-                        lines.append(
-                            f"            auto& Dest = Out.{field.name}.{value_member};"
-                        )
-                        lines.append("            Dest = {};")
-                        lines.append(
-                            f"            Out.{field.name}.{is_set_member} = true;"
-                        )
-                        lines.append(
-                            f"            bOk = FromProto(Source.{field_name}(), Dest, Context) && bOk;"
-                        )
-                else:
-                    lines.append(
-                        f"            bOk = FromProto(Source.{field_name}(), Out.{field.name}, Context) && bOk;"
+                    body = self._from_proto_optional_message_body(
+                        field, field_name, "            "
                     )
-            else:
-                value_expr = f"Source.{field_name}()"
-                if field.kind is model.FieldKind.ENUM:
-                    value_expr = f"static_cast<{field.base_type}>({value_expr})"
-                else:
-                    value_expr = self._from_proto_value(field, value_expr)
-                if field.is_optional:
-                    wrapper = field.optional_wrapper
-                    if wrapper is None:
-                        lines.append(
-                            f"            Out.{field.name} = {value_expr};"
-                        )
-                    else:
-                        lines.append(
-                            f"            Out.{field.name}.{wrapper.value_member} = {value_expr};"
-                        )
-                        lines.append(
-                            f"            Out.{field.name}.{wrapper.is_set_member} = true;"
-                        )
                 else:
-                    lines.append(
-                        f"            Out.{field.name} = {value_expr};"
+                    body = f"            bOk = FromProto(Source.{field_name}(), Out.{field.name}, Context) && bOk;"
+            else:
+                value_expr = self._from_proto_field_value(field, f"Source.{field_name}()")
+                wrapper = field.optional_wrapper
+                if field.is_optional and wrapper is not None:
+                    body = (
+                        f"            Out.{field.name}.{wrapper.value_member} = {value_expr};\n"
+                        f"            Out.{field.name}.{wrapper.is_set_member} = true;"
                     )
-            lines.append("            break;")
-            lines.append("        }")
-        lines.append("        default:")
-        lines.append("            break;")
-        lines.append("        }")
-        lines.append("    }")
-        return lines
-
-    def _field_scalar_type(self, field: UEField) -> Optional[str]:
-        source = field.source
-        if source is None:
-            return None
-        if field.kind is model.FieldKind.SCALAR:
-            return source.scalar
-        return None
-
-    def _map_key_scalar_type(self, field: UEField) -> Optional[str]:
-        source = field.source
-        if source is None or source.map_entry is None:
-            return None
-        entry = source.map_entry
-        if entry.key_kind is model.FieldKind.SCALAR:
-            return entry.key_scalar
-        return None
-
-    def _map_value_scalar_type(self, field: UEField) -> Optional[str]:
-        source = field.source
-        if source is None or source.map_entry is None:
-            return None
-        entry = source.map_entry
-        if entry.value_kind is model.FieldKind.SCALAR:
-            return entry.value_scalar
-        return None
+                else:
+                    body = f"            Out.{field.name} = {value_expr};"
+            blocks.append(
+                f"        case {case_name}: {{\n"
+                f"{body}\n"
+                "            break;\n"
+                "        }"
+            )
+        blocks.append(
+            "        default:\n"
+            "            break;\n"
+            "        }\n"
+            "    }"
+        )
+        return "\n".join(blocks)
 
     def _to_proto_value(self, field: UEField, value_expr: str) -> str:
-        scalar = self._field_scalar_type(field)
-        if scalar == "string":
-            return f"ToProtoString({value_expr})"
-        if scalar == "bytes":
-            return f"ToProtoBytes({value_expr})"
-        return value_expr
+        return _wrap_helper(self._field_helpers[id(field)].to_proto, value_expr)
 
     def _from_proto_value(self, field: UEField, value_expr: str) -> str:
-        scalar = self._field_scalar_type(field)
-        if scalar == "string":
-            return f"FromProtoString({value_expr})"
-        if scalar == "bytes":
-            return f"FromProtoBytes({value_expr})"
-        return value_expr
+        return _wrap_helper(self._field_helpers[id(field)].from_proto, value_expr)
 
     def _to_proto_map_key(self, field: UEField, key_expr: str) -> str:
-        scalar = self._map_key_scalar_type(field)
-        if scalar == "string":
-            return f"ToProtoString({key_expr})"
-        return key_expr
+        return _wrap_helper(self._field_helpers[id(field)].key_to_proto, key_expr)
 
     def _from_proto_map_key(self, field: UEField, key_expr: str) -> str:
-        scalar = self._map_key_scalar_type(field)
-        if scalar == "string":
-            return f"FromProtoString({key_expr})"
-        return key_expr
+        return _wrap_helper(self._field_helpers[id(field)].key_from_proto, key_expr)
 
     def _to_proto_map_value(self, field: UEField, value_expr: str) -> str:
-        scalar = self._map_value_scalar_type(field)
-        if scalar == "string":
-            return f"ToProtoString({value_expr})"
-        if scalar == "bytes":
-            return f"ToProtoBytes({value_expr})"
-        return value_expr
+        return _wrap_helper(self._field_helpers[id(field)].value_to_proto, value_expr)
 
     def _from_proto_map_value(self, field: UEField, value_expr: str) -> str:
-        scalar = self._map_value_scalar_type(field)
-        if scalar == "string":
-            return f"FromProtoString({value_expr})"
-        if scalar == "bytes":
-            return f"FromProtoBytes({value_expr})"
-        return value_expr
-
-    def _to_pascal_case(self, value: str) -> str:
-        parts = [part for part in value.split("_") if part]
-        return "".join(part[:1].upper() + part[1:] for part in parts) or value.title()
-
-    def _collect_messages(self, messages: Iterable[UEMessage]) -> Iterable[UEMessage]:
-        for message in messages:
-            yield message
-            yield from self._collect_messages(message.nested_messages)
+        return _wrap_helper(self._field_helpers[id(field)].value_from_proto, value_expr)
+
+    def _collect_messages(self, messages: Iterable[UEMessage]) -> List[UEMessage]:
+        collected: List[UEMessage] = []
+        stack = list(reversed(list(messages)))
+        while stack:
+            message = stack.pop()
+            collected.append(message)
+            stack.extend(reversed(message.nested_messages))
+        return collected
 
     def _converter_class_name(self) -> str:
         package = self._ue_file.package or ""
         if package:
-            parts = [self._to_pascal_case(part) for part in package.split(".") if part]
+            parts = [_to_pascal_case(part) for part in package.split(".") if part]
             base = "".join(parts)
         else:
             base_name = self._base_name().replace("\\", "/")
             leaf = base_name.rsplit("/", maxsplit=1)[-1]
-            base = self._to_pascal_case(leaf)
+            base = _to_pascal_case(leaf)
         if not base:
             base = "Proto"
         return f"F{base}ProtoConv"
@@ -1382,7 +1730,7 @@ class ConvertersTemplate:
     def _qualified_proto_type(self, message: UEMessage) -> str:
         if not message.source:
             raise ValueError("UEMessage is missing source metadata")
-        return "::".join(message.source.full_name.split("."))
+        return _format_proto_type_name(message.source.full_name)
 
     def _qualified_proto_enum_type(self, field: UEField) -> str:
         source = field.source
@@ -1390,9 +1738,9 @@ class ConvertersTemplate:
             raise ValueError("Field is missing source metadata")
         resolved = source.resolved_type
         if isinstance(resolved, model.Enum):
-            return self._format_proto_type_name(resolved.full_name)
+            return _format_proto_type_name(resolved.full_name)
         if source.type_name:
-            return self._format_proto_type_name(source.type_name)
+            return _format_proto_type_name(source.type_name)
         raise ValueError("Enum field is missing type information")
 
     def _qualified_proto_map_value_enum_type(self, field: UEField) -> str:
@@ -1402,16 +1750,14 @@ class ConvertersTemplate:
         entry = source.map_entry
         resolved = entry.value_resolved_type
         if isinstance(resolved, model.Enum):
-            return self._format_proto_type_name(resolved.full_name)
+            return _format_proto_type_name(resolved.full_name)
         if entry.value_type_name:
-            return self._format_proto_type_name(entry.value_type_name)
+            return _format_proto_type_name(entry.value_type_name)
         raise ValueError("Map enum value is missing type information")
 
-    def _format_proto_type_name(self, name: str) -> str:
-        stripped = name.lstrip(".")
-        if not stripped:
-            raise ValueError("Cannot qualify an empty proto type name")
-        return "::".join(stripped.split("."))
+    def _blueprint_base_name(self, message: UEMessage) -> str:
+        ue_name = message.ue_name
+        return ue_name[1:] if ue_name.startswith("F") else ue_name
 
     def _qualified_ue_type(self, message: UEMessage) -> str:
         return message.ue_name
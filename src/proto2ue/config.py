@@ -3,11 +3,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Iterable, List, Tuple
 
 _TRUE_VALUES = {"true", "1", "yes", "on"}
 _FALSE_VALUES = {"false", "0", "no", "off"}
+_BOOL_VALUES: Dict[str, bool] = {
+    **dict.fromkeys(_TRUE_VALUES, True),
+    **dict.fromkeys(_FALSE_VALUES, False),
+}
+_PARAMETER_SEPARATORS = str.maketrans({";": ","})
+_TOKEN_SEPARATORS = str.maketrans({"|": ",", ";": ","})
 
 DEFAULT_RESERVED_IDENTIFIERS: Tuple[str, ...] = (
     "FVector",
@@ -28,31 +35,23 @@ def _parse_parameter_string(parameter: str | None) -> Dict[str, str]:
     if not parameter:
         return {}
 
-    entries = parameter.replace(";", ",").split(",")
     result: Dict[str, str] = {}
-    for entry in entries:
+    for entry in parameter.translate(_PARAMETER_SEPARATORS).split(","):
         piece = entry.strip()
         if not piece:
             continue
-        if "=" in piece:
-            key, value = piece.split("=", 1)
-            result[key.strip().lower()] = value.strip()
-        else:
-            result[piece.lower()] = "true"
+        key, separator, value = piece.partition("=")
+        result[key.strip().lower()] = value.strip() if separator else "true"
     return result
 
 
 def _to_bool(value: object) -> bool | None:
-    if isinstance(value, bool):
-        return value
     if value is None:
         return None
+    if isinstance(value, bool):
+        return value
     if isinstance(value, str):
-        lowered = value.strip().lower()
-        if lowered in _TRUE_VALUES:
-            return True
-        if lowered in _FALSE_VALUES:
-            return False
+        return _BOOL_VALUES.get(value.strip().lower())
     if isinstance(value, (int, float)):
         return bool(value)
     return None
@@ -61,24 +60,29 @@ def _to_bool(value: object) -> bool | None:
 def _split_config_tokens(raw: str | None) -> List[str]:
     if not raw:
         return []
-    normalized = raw
-    for separator in ("|", ";"):
-        normalized = normalized.replace(separator, ",")
-    return [piece.strip() for piece in normalized.split(",") if piece.strip()]
+    return [
+        token
+        for piece in raw.translate(_TOKEN_SEPARATORS).split(",")
+        if (token := piece.strip())
+    ]
 
 
 def _load_identifier_file(path_value: str | None) -> List[str]:
     if not path_value:
         return []
-    path = Path(path_value).expanduser()
-    content = path.read_text(encoding="utf-8")
-    entries: List[str] = []
-    for line in content.splitlines():
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-        entries.append(stripped)
-    return entries
+    path = Path(path_value).expanduser().resolve()
+    return list(_read_identifier_file(str(path), path.stat().st_mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _read_identifier_file(path: str, mtime_ns: int) -> Tuple[str, ...]:
+    # Keyed on the modification time so edited files are re-read.
+    content = Path(path).read_text(encoding="utf-8")
+    return tuple(
+        stripped
+        for line in content.splitlines()
+        if (stripped := line.strip()) and not stripped.startswith("#")
+    )
 
 
 def _parse_rename_entries(entries: Iterable[str]) -> Dict[str, str]:
@@ -86,11 +90,11 @@ def _parse_rename_entries(entries: Iterable[str]) -> Dict[str, str]:
     for entry in entries:
         if not entry:
             continue
-        if ":" not in entry:
+        proto_name, separator, ue_name = entry.partition(":")
+        if not separator:
             raise ValueError(
                 "Rename override entries must use the form 'full.proto.Name:UEName'"
             )
-        proto_name, ue_name = entry.split(":", 1)
         proto_key = proto_name.strip()
         ue_value = ue_name.strip()
         if not proto_key or not ue_value:
@@ -109,6 +113,9 @@ class GeneratorConfig:
     reserved_identifiers: Tuple[str, ...] = DEFAULT_RESERVED_IDENTIFIERS
     rename_overrides: Dict[str, str] = field(default_factory=dict)
     include_package_in_names: bool = True
+    use_simdutf: bool = False
+    legacy_traits: bool = False
+    parallel: bool = False
 
     @classmethod
     def from_parameter_string(cls, parameter: str | None) -> "GeneratorConfig":
@@ -145,12 +152,19 @@ class GeneratorConfig:
         include_package_flag = overrides.get("include_package_in_names")
         include_package_value = _to_bool(include_package_flag)
 
+        use_simdutf_value = _to_bool(overrides.get("use_simdutf"))
+        legacy_traits_value = _to_bool(overrides.get("legacy_traits"))
+        parallel_value = _to_bool(overrides.get("parallel"))
+
         return cls(
             convert_unsigned_to_blueprint=convert_value if convert_value is not None else False,
             reserved_identifiers=unique_reserved,
             rename_overrides=rename_overrides,
             include_package_in_names=
                 include_package_value if include_package_value is not None else True,
+            use_simdutf=use_simdutf_value if use_simdutf_value is not None else False,
+            legacy_traits=legacy_traits_value if legacy_traits_value is not None else False,
+            parallel=parallel_value if parallel_value is not None else False,
         )
 
 
@@ -2,10 +2,14 @@ from __future__ import annotations
 
 """Utilities to convert CodeGeneratorRequest payloads into model dataclasses."""
 
+from collections import OrderedDict
+import copy
 from dataclasses import dataclass
-from typing import Callable, Dict, Iterable, List, MutableMapping, Optional, Tuple
+import sys
+from typing import Any, Callable, Dict, Iterable, List, MutableMapping, Optional, Tuple
 
 from google.protobuf import json_format
+from google.protobuf.descriptor import FieldDescriptor
 from google.protobuf.compiler import plugin_pb2
 from google.protobuf import descriptor_pb2
 from google.protobuf.message import Message
@@ -35,15 +39,26 @@ class DescriptorLoader:
         request: plugin_pb2.CodeGeneratorRequest,
         *,
         option_validator: Optional[OptionValidator] = None,
+        enable_cache: bool = False,
+        parallel: bool = False,
     ) -> None:
         self._request = request
+        self._enable_cache = enable_cache
+        self._parallel = parallel
+        self._proto_file_by_name: Dict[str, descriptor_pb2.FileDescriptorProto] = {
+            fp.name: fp for fp in request.proto_file
+        }
         self._option_validator = option_validator
         self._loaded_files: MutableMapping[str, model.ProtoFile] = {}
         self._type_index: Dict[str, model.ProtoType] = {}
         self._pending_field_resolutions: List[Tuple[model.Field, str]] = []
         self._pending_map_resolutions: List[Tuple[model.MapEntry, str, str]] = []
         self._map_entry_descriptors: Dict[str, descriptor_pb2.DescriptorProto] = {}
-        self._loaded = False
+        self._message_to_dict_kwargs: Dict[str, bool] = {
+            "preserving_proto_field_name": True,
+            "including_default_value_fields": False,
+        }
+        self._loaded: set[str] = set()
 
     @property
     def files(self) -> MutableMapping[str, model.ProtoFile]:
@@ -59,79 +74,186 @@ class DescriptorLoader:
         return list(self._request.file_to_generate)
 
     def get_file(self, name: str) -> model.ProtoFile:
-        """Return a loaded :class:`ProtoFile` by name."""
+        """Return a loaded :class:`ProtoFile` by name, loading it on first use."""
 
-        self.load()
-        return self._loaded_files[name]
+        return self.load([name])[name]
 
     def load(self, file_names: Optional[Iterable[str]] = None) -> MutableMapping[str, model.ProtoFile]:
         """Load requested files and return the mapping of filenames to :class:`ProtoFile`.
 
         If ``file_names`` is ``None`` all files present in the request are loaded.
+        Otherwise only the named files and their transitive imports are converted.
         Subsequent calls return cached results.
         """
 
-        if self._loaded:
-            if file_names is None:
-                return self._loaded_files
-            return {name: self._loaded_files[name] for name in file_names}
-
-        for file_proto in self._request.proto_file:
-            proto_file = self._convert_file(file_proto)
-            self._loaded_files[file_proto.name] = proto_file
-
-        self._resolve_type_references()
-        self._loaded = True
-
         if file_names is None:
+            self._load_closure(self._proto_file_by_name)
             return self._loaded_files
 
-        missing = sorted(name for name in file_names if name not in self._loaded_files)
+        names = list(file_names)
+        missing = sorted(name for name in names if name not in self._proto_file_by_name)
         if missing:
             raise KeyError(f"Descriptor(s) not found in request: {', '.join(missing)}")
-        return {name: self._loaded_files[name] for name in file_names}
+        self._load_closure(names)
+        return {name: self._loaded_files[name] for name in names}
+
+    def _load_closure(self, file_names: Iterable[str]) -> None:
+        pending = [name for name in file_names if name not in self._loaded]
+        if not pending:
+            return
+
+        closure: set[str] = set()
+        while pending:
+            name = pending.pop()
+            if name in closure or name in self._loaded:
+                continue
+            closure.add(name)
+            file_proto = self._proto_file_by_name.get(name)
+            if file_proto is not None:
+                pending.extend(file_proto.dependency)
+
+        reorder = bool(self._loaded_files)
+        batch = [
+            (name, file_proto)
+            for name, file_proto in self._proto_file_by_name.items()
+            if name in closure
+        ]
+        if self._parallel and self._option_validator is None and len(batch) > 1:
+            converted = self._convert_files_in_parallel([file_proto for _, file_proto in batch])
+        else:
+            converted = [self._convert_file(file_proto) for _, file_proto in batch]
+        for (name, _), proto_file in zip(batch, converted):
+            self._loaded_files[name] = proto_file
+            self._loaded.add(name)
+        if reorder:
+            # Keep the mapping in request order however the files were loaded.
+            ordered = [
+                (name, self._loaded_files[name])
+                for name in self._proto_file_by_name
+                if name in self._loaded_files
+            ]
+            self._loaded_files.clear()
+            self._loaded_files.update(ordered)
+
+        self._resolve_type_references()
+        self._pending_field_resolutions.clear()
+        self._pending_map_resolutions.clear()
 
     def _convert_file(
         self,
         file_proto: descriptor_pb2.FileDescriptorProto,
+    ) -> model.ProtoFile:
+        # Validators observe every element, so cached conversions are only
+        # reused when none is installed.
+        if not self._enable_cache or self._option_validator is not None:
+            proto_file = self._build_file(file_proto)
+        else:
+            key = file_proto.SerializeToString(deterministic=True)
+            cached = _FILE_CACHE.get(key)
+            if cached is not None:
+                _FILE_CACHE.move_to_end(key)
+                proto_file = self._adopt_file(copy.deepcopy(cached))
+            else:
+                proto_file = self._build_file(file_proto)
+                _FILE_CACHE[key] = _detach_file(proto_file)
+                if len(_FILE_CACHE) > _FILE_CACHE_SIZE:
+                    _FILE_CACHE.popitem(last=False)
+        self._check_dependencies(proto_file)
+        return proto_file
+
+    def _convert_files_in_parallel(
+        self, file_protos: List[descriptor_pb2.FileDescriptorProto]
+    ) -> List[model.ProtoFile]:
+        # Imported lazily so sequential loads skip the multiprocessing import.
+        from concurrent.futures import ProcessPoolExecutor
+
+        # Each worker converts one file in isolation; references between files
+        # are resolved here once every result has been adopted.
+        payloads = [file_proto.SerializeToString() for file_proto in file_protos]
+        with ProcessPoolExecutor() as executor:
+            built = list(executor.map(_build_file_in_worker, payloads))
+        for proto_file in built:
+            self._adopt_file(proto_file)
+            self._check_dependencies(proto_file)
+        return built
+
+    def _build_file(
+        self,
+        file_proto: descriptor_pb2.FileDescriptorProto,
     ) -> model.ProtoFile:
         package = file_proto.package or None
         options = self._normalize_options(
             file_proto.options,
             OptionContext(element_type="file", file_name=file_proto.name, full_name=package),
         )
-        dependencies = list(file_proto.dependency)
-        public_dependencies = [file_proto.dependency[i] for i in file_proto.public_dependency]
+        dependencies = tuple(file_proto.dependency)
 
         proto_file = model.ProtoFile(
             name=file_proto.name,
             package=package,
-            dependencies=dependencies,
-            public_dependencies=public_dependencies,
+            dependencies=list(dependencies),
+            public_dependencies=[dependencies[i] for i in file_proto.public_dependency],
             options=options,
         )
 
         for enum_proto in file_proto.enum_type:
-            enum = self._convert_enum(enum_proto, file_proto, [])
+            enum = self._convert_enum(enum_proto, file_proto, ())
             proto_file.enums.append(enum)
 
         for message_proto in file_proto.message_type:
-            message = self._convert_message(message_proto, file_proto, [])
+            message = self._convert_message(message_proto, file_proto, ())
             proto_file.messages.append(message)
 
+        return proto_file
+
+    def _check_dependencies(self, proto_file: model.ProtoFile) -> None:
         for dependency in proto_file.dependencies:
-            if dependency not in {fp.name for fp in self._request.proto_file}:
+            if dependency not in self._proto_file_by_name:
                 raise KeyError(
-                    f"Unresolved dependency '{dependency}' referenced by {file_proto.name}"
+                    f"Unresolved dependency '{dependency}' referenced by {proto_file.name}"
                 )
 
+    def _adopt_file(self, proto_file: model.ProtoFile) -> model.ProtoFile:
+        """Register a file converted elsewhere and queue its cross-file references."""
+
+        enums, messages = _collect_file_types(proto_file)
+        for enum in enums:
+            self._register_type(enum.full_name, enum)
+        for message in messages:
+            self._register_type(message.full_name, message)
+
+        # References into the file itself survive the copy; the rest are
+        # resolved with the other pending references of this batch.
+        for message in messages:
+            for field in message.fields:
+                if field.resolved_type is None and field.kind in _REFERENCE_KINDS and field.type_name:
+                    self._pending_field_resolutions.append((field, field.type_name))
+                map_entry = field.map_entry
+                if map_entry is None:
+                    continue
+                if (
+                    map_entry.value_resolved_type is None
+                    and map_entry.value_kind in _REFERENCE_KINDS
+                    and map_entry.value_type_name
+                ):
+                    self._pending_map_resolutions.append(
+                        (map_entry, map_entry.value_type_name, "value")
+                    )
+                if (
+                    map_entry.key_resolved_type is None
+                    and map_entry.key_kind in _REFERENCE_KINDS
+                    and map_entry.key_type_name
+                ):
+                    self._pending_map_resolutions.append(
+                        (map_entry, map_entry.key_type_name, "key")
+                    )
         return proto_file
 
     def _convert_enum(
         self,
         enum_proto: descriptor_pb2.EnumDescriptorProto,
         file_proto: descriptor_pb2.FileDescriptorProto,
-        parents: List[str],
+        parents: Tuple[str, ...],
     ) -> model.Enum:
         full_name = self._qualify_name(file_proto.package, parents, enum_proto.name)
         options = self._normalize_options(
@@ -145,20 +267,24 @@ class DescriptorLoader:
         enum = model.Enum(name=enum_proto.name, full_name=full_name, options=options)
         self._register_type(full_name, enum)
 
+        file_name = file_proto.name
+        normalize_options = self._normalize_options
+        append_value = enum.values.append
         for value_proto in enum_proto.value:
             value_context = OptionContext(
                 element_type="enum_value",
-                file_name=file_proto.name,
+                file_name=file_name,
                 full_name=full_name,
                 field_name=value_proto.name,
             )
-            value_options = self._normalize_options(value_proto.options, value_context)
-            enum_value = model.EnumValue(
-                name=value_proto.name,
-                number=value_proto.number,
-                options=value_options,
+            value_options = normalize_options(value_proto.options, value_context)
+            append_value(
+                model.EnumValue(
+                    name=value_proto.name,
+                    number=value_proto.number,
+                    options=value_options,
+                )
             )
-            enum.values.append(enum_value)
 
         return enum
 
@@ -166,7 +292,7 @@ class DescriptorLoader:
         self,
         message_proto: descriptor_pb2.DescriptorProto,
         file_proto: descriptor_pb2.FileDescriptorProto,
-        parents: List[str],
+        parents: Tuple[str, ...],
     ) -> model.Message:
         full_name = self._qualify_name(file_proto.package, parents, message_proto.name)
         options = self._normalize_options(
@@ -187,7 +313,7 @@ class DescriptorLoader:
         )
         self._register_type(full_name, message)
 
-        parents_chain = parents + [message_proto.name]
+        parents_chain = parents + (message_proto.name,)
 
         for idx, oneof_proto in enumerate(message_proto.oneof_decl):
             oneof_full_name = f"{full_name}.{oneof_proto.name}"
@@ -214,13 +340,15 @@ class DescriptorLoader:
             nested_enum = self._convert_enum(enum_proto, file_proto, parents_chain)
             message.nested_enums.append(nested_enum)
 
+        file_name = file_proto.name
+        convert_field = self._convert_field
+        append_field = message.fields.append
+        oneofs = message.oneofs
         for field_proto in message_proto.field:
-            field = self._convert_field(field_proto, message, file_proto.name)
-            message.fields.append(field)
-
-        for field in message.fields:
+            field = convert_field(field_proto, message, file_name)
+            append_field(field)
             if field.oneof_index is not None:
-                message.oneofs[field.oneof_index].fields.append(field)
+                oneofs[field.oneof_index].fields.append(field)
 
         return message
 
@@ -231,11 +359,10 @@ class DescriptorLoader:
         file_name: str,
     ) -> model.Field:
         label = field_proto.label
-        cardinality = {
-            descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL: model.FieldCardinality.OPTIONAL,
-            descriptor_pb2.FieldDescriptorProto.LABEL_REQUIRED: model.FieldCardinality.REQUIRED,
-            descriptor_pb2.FieldDescriptorProto.LABEL_REPEATED: model.FieldCardinality.REPEATED,
-        }[label]
+        in_range = 0 <= label < len(_CARDINALITY_BY_LABEL)
+        cardinality = _CARDINALITY_BY_LABEL[label] if in_range else None
+        if cardinality is None:
+            raise ValueError(f"Unsupported field label: {label}")
 
         kind, scalar, type_name = self._classify_field_type(field_proto)
 
@@ -256,7 +383,8 @@ class DescriptorLoader:
             full_name=message.full_name,
             field_name=field_proto.name,
         )
-        options = self._normalize_options(field_proto.options, context)
+        field_options = field_proto.options
+        options = self._normalize_options(field_options, context)
         json_name = field_proto.json_name or None
         default_value = field_proto.default_value or None
         oneof_index = field_proto.oneof_index if field_proto.HasField("oneof_index") else None
@@ -278,29 +406,36 @@ class DescriptorLoader:
             options=options,
         )
 
-        if field_proto.options and field_proto.options.HasField("packed"):
-            field.packed = field_proto.options.packed
+        if field_options and field_options.HasField("packed"):
+            field.packed = field_options.packed
 
-        if field.kind is model.FieldKind.MESSAGE and field.type_name:
-            self._pending_field_resolutions.append((field, field.type_name))
-        elif field.kind is model.FieldKind.ENUM and field.type_name:
-            self._pending_field_resolutions.append((field, field.type_name))
-
-        if field.map_entry:
-            if (
-                field.map_entry.value_kind in (model.FieldKind.MESSAGE, model.FieldKind.ENUM)
-                and field.map_entry.value_type_name
-            ):
-                self._pending_map_resolutions.append(
-                    (field.map_entry, field.map_entry.value_type_name, "value")
-                )
-            if (
-                field.map_entry.key_kind in (model.FieldKind.MESSAGE, model.FieldKind.ENUM)
-                and field.map_entry.key_type_name
-            ):
-                self._pending_map_resolutions.append(
-                    (field.map_entry, field.map_entry.key_type_name, "key")
-                )
+        # Types defined earlier resolve straight away; forward references are
+        # deferred until the whole batch of files has been converted.
+        type_index = self._type_index
+        if kind in _REFERENCE_KINDS and normalized_type_name:
+            resolved = type_index.get(normalized_type_name)
+            if resolved is not None:
+                field.resolved_type = resolved
+            else:
+                self._pending_field_resolutions.append((field, normalized_type_name))
+
+        if map_entry is not None:
+            if map_entry.value_kind in _REFERENCE_KINDS and map_entry.value_type_name:
+                resolved = type_index.get(map_entry.value_type_name)
+                if resolved is not None:
+                    map_entry.value_resolved_type = resolved
+                else:
+                    self._pending_map_resolutions.append(
+                        (map_entry, map_entry.value_type_name, "value")
+                    )
+            if map_entry.key_kind in _REFERENCE_KINDS and map_entry.key_type_name:
+                resolved = type_index.get(map_entry.key_type_name)
+                if resolved is not None:
+                    map_entry.key_resolved_type = resolved
+                else:
+                    self._pending_map_resolutions.append(
+                        (map_entry, map_entry.key_type_name, "key")
+                    )
 
         return field
 
@@ -326,41 +461,45 @@ class DescriptorLoader:
         self, field_proto: descriptor_pb2.FieldDescriptorProto
     ) -> Tuple[model.FieldKind, Optional[str], Optional[str]]:
         field_type = field_proto.type
-        if field_type in _SCALAR_TYPE_NAMES:
-            return model.FieldKind.SCALAR, _SCALAR_TYPE_NAMES[field_type], None
+        if 0 <= field_type < len(_SCALAR_TYPE_TABLE):
+            scalar = _SCALAR_TYPE_TABLE[field_type]
+            if scalar is not None:
+                return model.FieldKind.SCALAR, scalar, None
         if field_type == descriptor_pb2.FieldDescriptorProto.TYPE_ENUM:
-            return model.FieldKind.ENUM, None, self._normalize_type_name(field_proto.type_name)
-        if field_type == descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE:
-            return model.FieldKind.MESSAGE, None, self._normalize_type_name(field_proto.type_name)
-        raise ValueError(f"Unsupported field type: {field_type}")
-
-    def _normalize_type_name(self, type_name: str) -> str:
-        if not type_name:
-            return type_name
-        return type_name[1:] if type_name.startswith(".") else type_name
+            kind = model.FieldKind.ENUM
+        elif field_type == descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE:
+            kind = model.FieldKind.MESSAGE
+        else:
+            raise ValueError(f"Unsupported field type: {field_type}")
+        type_name = field_proto.type_name
+        # Referenced type names repeat across many fields; intern them so they
+        # share storage and hit the identity fast path in ``_type_index``.
+        return kind, None, sys.intern(type_name[1:] if type_name.startswith(".") else type_name)
 
     def _register_type(self, full_name: str, obj: model.ProtoType) -> None:
         self._type_index[full_name] = obj
 
     def _qualify_name(
-        self, package: Optional[str], parents: List[str], name: str
+        self, package: Optional[str], parents: Tuple[str, ...], name: str
     ) -> str:
-        segments: List[str] = []
-        if package:
-            segments.append(package)
-        segments.extend(parents)
-        segments.append(name)
-        return ".".join(segment for segment in segments if segment)
+        # ``package`` is either empty or a dotted prefix and parent names are
+        # never empty, so the segments can be joined without filtering.
+        if parents:
+            if package:
+                return sys.intern(".".join((package, *parents, name)))
+            return sys.intern(".".join((*parents, name)))
+        return sys.intern(f"{package}.{name}" if package else name)
 
     def _normalize_options(
         self,
         options: Optional[Message],
         context: OptionContext,
     ) -> OptionDict:
-        if options is None:
-            normalized: OptionDict = {}
-        else:
-            normalized = self._message_to_dict(options)
+        normalized: OptionDict = {}
+        # Most elements carry no options at all; skip the conversion for them.
+        if options is not None and options.ByteSize():
+            converted = _options_to_dict(options)
+            normalized = converted if converted is not None else self._message_to_dict(options)
         if self._option_validator is not None:
             self._option_validator(context, normalized)
         return normalized
@@ -368,14 +507,15 @@ class DescriptorLoader:
     def _message_to_dict(self, message: Message) -> OptionDict:
         """Convert a protobuf message to a dictionary handling protobuf version differences."""
 
-        kwargs = {
-            "preserving_proto_field_name": True,
-            "including_default_value_fields": False,
-        }
+        kwargs = self._message_to_dict_kwargs
         try:
             return json_format.MessageToDict(message, **kwargs)
         except TypeError:
-            kwargs.pop("including_default_value_fields")
+            if "including_default_value_fields" not in kwargs:
+                raise
+            # Newer protobuf releases dropped the keyword; remember that so
+            # later conversions skip the failing attempt.
+            kwargs = self._message_to_dict_kwargs = {"preserving_proto_field_name": True}
             return json_format.MessageToDict(message, **kwargs)
 
     def _resolve_type_references(self) -> None:
@@ -413,3 +553,124 @@ _SCALAR_TYPE_NAMES: Dict[int, str] = {
     descriptor_pb2.FieldDescriptorProto.TYPE_SINT64: "sint64",
 }
 
+# ``FieldDescriptorProto.Type`` values are small and contiguous; index them
+# directly instead of hashing. Non-scalar slots hold ``None``.
+_SCALAR_TYPE_TABLE: Tuple[Optional[str], ...] = tuple(
+    _SCALAR_TYPE_NAMES.get(index) for index in range(max(_SCALAR_TYPE_NAMES) + 1)
+)
+
+# Option field types whose MessageToDict rendering is the plain Python value
+# (enums aside, which render as their value name).
+_DIRECT_OPTION_TYPES = frozenset(
+    {
+        FieldDescriptor.TYPE_BOOL,
+        FieldDescriptor.TYPE_STRING,
+        FieldDescriptor.TYPE_INT32,
+        FieldDescriptor.TYPE_UINT32,
+        FieldDescriptor.TYPE_SINT32,
+        FieldDescriptor.TYPE_FIXED32,
+        FieldDescriptor.TYPE_SFIXED32,
+        FieldDescriptor.TYPE_ENUM,
+        FieldDescriptor.TYPE_MESSAGE,
+    }
+)
+
+
+def _options_to_dict(message: Message) -> Optional[OptionDict]:
+    """Convert plain options messages by walking their set fields.
+
+    Returns ``None`` when the message uses anything that ``MessageToDict``
+    renders specially (extensions, 64-bit integers, floats, bytes, maps or
+    well-known types) so the caller can fall back to it.
+    """
+
+    result: OptionDict = {}
+    for field, value in message.ListFields():
+        if field.is_extension or field.type not in _DIRECT_OPTION_TYPES:
+            return None
+        if field.type == FieldDescriptor.TYPE_MESSAGE:
+            message_type = field.message_type
+            if message_type.GetOptions().map_entry or (
+                message_type.full_name.startswith("google.protobuf.")
+                and message_type.file.name != "google/protobuf/descriptor.proto"
+            ):
+                return None
+        if field.label == FieldDescriptor.LABEL_REPEATED:
+            items = [_option_value(field, item) for item in value]
+            if any(item is _UNSUPPORTED for item in items):
+                return None
+            result[field.name] = items
+        else:
+            converted = _option_value(field, value)
+            if converted is _UNSUPPORTED:
+                return None
+            result[field.name] = converted
+    return result
+
+
+def _option_value(field: FieldDescriptor, value: Any) -> object:
+    if field.type == FieldDescriptor.TYPE_MESSAGE:
+        converted = _options_to_dict(value)
+        return _UNSUPPORTED if converted is None else converted
+    if field.type == FieldDescriptor.TYPE_ENUM:
+        enum_value = field.enum_type.values_by_number.get(value)
+        return enum_value.name if enum_value is not None else value
+    return value
+
+
+_UNSUPPORTED = object()
+
+
+# Converted files shared by loaders created with ``enable_cache=True``, keyed by
+# the deterministic serialization of their FileDescriptorProto.
+_FILE_CACHE_SIZE = 256
+_FILE_CACHE: "OrderedDict[bytes, model.ProtoFile]" = OrderedDict()
+
+
+def _collect_file_types(
+    proto_file: model.ProtoFile,
+) -> Tuple[List[model.Enum], List[model.Message]]:
+    enums: List[model.Enum] = list(proto_file.enums)
+    messages: List[model.Message] = []
+    stack = list(reversed(proto_file.messages))
+    while stack:
+        message = stack.pop()
+        messages.append(message)
+        enums.extend(message.nested_enums)
+        stack.extend(reversed(message.nested_messages))
+    return enums, messages
+
+
+def _detach_file(proto_file: model.ProtoFile) -> model.ProtoFile:
+    """Deep-copy ``proto_file`` with references to other files' types cleared."""
+
+    enums, messages = _collect_file_types(proto_file)
+    own = {id(obj) for obj in enums}
+    own.update(id(obj) for obj in messages)
+    memo: Dict[int, object] = {}
+    for message in messages:
+        for field in message.fields:
+            targets = [field.resolved_type]
+            if field.map_entry is not None:
+                targets.append(field.map_entry.key_resolved_type)
+                targets.append(field.map_entry.value_resolved_type)
+            for target in targets:
+                if target is not None and id(target) not in own:
+                    memo[id(target)] = None
+    return copy.deepcopy(proto_file, memo)
+
+
+def _build_file_in_worker(payload: bytes) -> model.ProtoFile:
+    file_proto = descriptor_pb2.FileDescriptorProto.FromString(payload)
+    return DescriptorLoader(plugin_pb2.CodeGeneratorRequest())._build_file(file_proto)
+
+
+_REFERENCE_KINDS = (model.FieldKind.MESSAGE, model.FieldKind.ENUM)
+
+# Indexed by ``FieldDescriptorProto.Label`` (LABEL_OPTIONAL = 1 ... LABEL_REPEATED = 3).
+_CARDINALITY_BY_LABEL: Tuple[Optional[model.FieldCardinality], ...] = (
+    None,
+    model.FieldCardinality.OPTIONAL,
+    model.FieldCardinality.REQUIRED,
+    model.FieldCardinality.REPEATED,
+)
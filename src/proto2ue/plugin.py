@@ -1,20 +1,29 @@
 """Protocol Buffers compiler plugin entry point for proto2ue."""
 from __future__ import annotations
 
+import os
 import sys
-from typing import Any, Iterable
+from typing import TYPE_CHECKING, Any, Iterable, List, Tuple
 
-from google.protobuf.compiler import plugin_pb2
+if TYPE_CHECKING:
+    from google.protobuf.compiler import plugin_pb2
 
-from .codegen import DefaultTemplateRenderer, GeneratedFile, ITemplateRenderer
-from .config import GeneratorConfig
-from .descriptor_loader import DescriptorLoader
-from .type_mapper import TypeMapper
+    from .codegen import GeneratedFile, ITemplateRenderer
+    from .config import GeneratorConfig
+    from .type_mapper import UEProtoFile
+
+# The protobuf runtime and the generation pipeline are imported inside the
+# functions below so importing this module stays cheap.
+
+# Below this many files the process pool start-up outweighs the rendering.
+_PARALLEL_RENDER_MIN_FILES = 3
 
 
 def analyze_descriptors(request: plugin_pb2.CodeGeneratorRequest) -> Any:
     """Normalize descriptors into the proto2ue intermediate model."""
 
+    from .descriptor_loader import DescriptorLoader
+
     loader = DescriptorLoader(request)
     return loader.load()
 
@@ -24,8 +33,21 @@ def generate_code(
     *,
     renderer: ITemplateRenderer | None = None,
     config: GeneratorConfig | None = None,
+    parallel: bool | None = None,
 ) -> plugin_pb2.CodeGeneratorResponse:
-    """Run the proto2ue pipeline and return a populated response message."""
+    """Run the proto2ue pipeline and return a populated response message.
+
+    With ``parallel`` enabled the mapped files are rendered in worker
+    processes; ``renderer`` must then be picklable. When omitted it follows
+    the ``parallel`` generator option.
+    """
+
+    from google.protobuf.compiler import plugin_pb2
+
+    from .codegen import DefaultTemplateRenderer
+    from .config import GeneratorConfig
+    from .descriptor_loader import DescriptorLoader
+    from .type_mapper import TypeMapper
 
     loader = DescriptorLoader(request)
     loader.load()
@@ -41,10 +63,19 @@ def generate_code(
 
     type_mapper.register_files(loader.files.values())
 
-    for file_name in files_to_generate:
-        proto_file = loader.get_file(file_name)
-        ue_file = type_mapper.map_file(proto_file)
-        generated_files: Iterable[GeneratedFile] = renderer.render(ue_file)
+    # Mapping shares the type mapper's symbol state, so it always runs here;
+    # only the independent per-file rendering is farmed out.
+    ue_files = [
+        type_mapper.map_file(loader.get_file(file_name)) for file_name in files_to_generate
+    ]
+    if parallel is None:
+        parallel = effective_config.parallel
+    if parallel and len(ue_files) >= _PARALLEL_RENDER_MIN_FILES:
+        rendered = _render_files_in_parallel(renderer, ue_files)
+    else:
+        rendered = [renderer.render(ue_file) for ue_file in ue_files]
+
+    for generated_files in rendered:
         for generated in generated_files:
             response_file = response.file.add()
             response_file.name = generated.name
@@ -53,9 +84,30 @@ def generate_code(
     return response
 
 
+def _render_files_in_parallel(
+    renderer: ITemplateRenderer, ue_files: List[UEProtoFile]
+) -> List[Iterable[GeneratedFile]]:
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_workers = min(len(ue_files), os.cpu_count() or 1)
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(
+            executor.map(_render_file_in_worker, [(renderer, ue_file) for ue_file in ue_files])
+        )
+
+
+def _render_file_in_worker(
+    payload: Tuple[ITemplateRenderer, UEProtoFile]
+) -> List[GeneratedFile]:
+    renderer, ue_file = payload
+    return list(renderer.render(ue_file))
+
+
 def main() -> None:
     """Execute the protoc plugin workflow."""
 
+    from google.protobuf.compiler import plugin_pb2
+
     request_payload = sys.stdin.buffer.read()
 
     request = plugin_pb2.CodeGeneratorRequest()
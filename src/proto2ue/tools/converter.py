@@ -10,6 +10,7 @@ from google.protobuf import descriptor_pb2
 from google.protobuf.compiler import plugin_pb2
 
 from proto2ue.codegen.converters import ConvertersTemplate, converter_output_path
+from proto2ue.config import GeneratorConfig
 from proto2ue.descriptor_loader import DescriptorLoader
 from proto2ue.type_mapper import TypeMapper
 
@@ -45,6 +46,7 @@ def generate_converters(
     descriptor_set_path: Path | str,
     targets: Sequence[str] | None,
     output_dir: Path | str,
+    config: GeneratorConfig | None = None,
 ) -> List[Path]:
     """Generate converter files for the given targets.
 
@@ -56,6 +58,8 @@ def generate_converters(
         Proto filenames (as understood by ``protoc``) to generate. ``None`` means "all".
     output_dir:
         Directory that will receive the ``_proto2ue_converters.{h,cpp}`` files.
+    config:
+        Generator options shared with the ``protoc`` plugin. Defaults apply when omitted.
     """
 
     descriptor_set_path = Path(descriptor_set_path)
@@ -69,7 +73,8 @@ def generate_converters(
     loader = DescriptorLoader(request)
     loader.load()
 
-    type_mapper = TypeMapper()
+    effective_config = config or GeneratorConfig()
+    type_mapper = TypeMapper(config=effective_config)
     type_mapper.register_files(loader.files.values())
 
     generated_paths: List[Path] = []
@@ -77,16 +82,15 @@ def generate_converters(
 
     for proto_name in resolved_targets:
         ue_file = type_mapper.map_file(loader.get_file(proto_name))
-        template = ConvertersTemplate(ue_file)
-        rendered = template.render()
+        template = ConvertersTemplate(ue_file, effective_config)
 
         header_rel = converter_output_path(ue_file.name, "_proto2ue_converters.h")
         source_rel = converter_output_path(ue_file.name, "_proto2ue_converters.cpp")
         header_path = output_dir / Path(str(header_rel))
         source_path = output_dir / Path(str(source_rel))
         header_path.parent.mkdir(parents=True, exist_ok=True)
-        header_path.write_text(rendered.header)
-        source_path.write_text(rendered.source)
+        with header_path.open("w") as header, source_path.open("w") as source:
+            template.write(header, source)
 
         generated_paths.extend([header_path, source_path])
 
@@ -120,6 +124,14 @@ def _build_argument_parser() -> argparse.ArgumentParser:
         type=Path,
         help="Directory to write the generated converter sources to",
     )
+    parser.add_argument(
+        "--parameter",
+        default=None,
+        help=(
+            "Generator options in the same form as the protoc plugin parameter, "
+            "e.g. 'use_simdutf=true'"
+        ),
+    )
     return parser
 
 
@@ -129,7 +141,10 @@ def main(argv: Sequence[str] | None = None) -> int:
     parser = _build_argument_parser()
     args = parser.parse_args(argv)
 
-    generated_paths = generate_converters(args.descriptor_set, args.protos, args.output)
+    config = GeneratorConfig.from_parameter_string(args.parameter)
+    generated_paths = generate_converters(
+        args.descriptor_set, args.protos, args.output, config
+    )
 
     for path in generated_paths:
         print(path)
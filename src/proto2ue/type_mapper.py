@@ -85,7 +85,7 @@ class UEOneofWrapper:
     source: model.Oneof | None = None
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, weakref_slot=True)
 class UEMessage:
     """Represents a UE message."""
 
@@ -136,6 +136,27 @@ class UEOptionalWrapper:
 class TypeMapper:
     """Maps `proto2ue.model` dataclasses into Unreal Engine focused dataclasses."""
 
+    __slots__ = (
+        "_config",
+        "_message_prefix",
+        "_enum_prefix",
+        "_optional_wrapper_prefix",
+        "_array_wrapper",
+        "_map_wrapper",
+        "_symbol_table",
+        "_symbol_table_get",
+        "_used_ue_names",
+        "_collision_counters",
+        "_package",
+        "_current_optional_wrappers",
+        "_current_file_suffix",
+        "_current_proto_file_name",
+        "_type_file_index",
+        "_reserved_identifiers",
+        "_rename_overrides",
+        "_include_package_in_names",
+    )
+
     _SCALAR_MAPPING: Dict[str, str] = {
         "double": "double",
         "float": "float",
@@ -173,6 +194,9 @@ class TypeMapper:
         self._array_wrapper = array_wrapper
         self._map_wrapper = map_wrapper
         self._symbol_table: Dict[str, _UESymbol] = {}
+        self._symbol_table_get = self._symbol_table.get
+        self._used_ue_names: set[str] = set()
+        self._collision_counters: Dict[str, int] = {}
         self._package: Optional[str] = None
         self._current_optional_wrappers: Dict[str, UEOptionalWrapper] = {}
         self._current_file_suffix: Optional[str] = None
@@ -243,12 +267,12 @@ class TypeMapper:
     # Symbol table helpers -------------------------------------------------
     def _register_enum(self, enum: model.Enum, *, file_name: str) -> None:
         ue_name = self._resolve_type_name(enum.full_name, self._enum_prefix)
-        self._symbol_table[enum.full_name] = _UESymbol("enum", ue_name)
+        self._register_symbol(enum.full_name, _UESymbol("enum", ue_name))
         self._type_file_index[id(enum)] = file_name
 
     def _register_message(self, message: model.Message, *, file_name: str) -> None:
         ue_name = self._resolve_type_name(message.full_name, self._message_prefix)
-        self._symbol_table[message.full_name] = _UESymbol("message", ue_name)
+        self._register_symbol(message.full_name, _UESymbol("message", ue_name))
         self._type_file_index[id(message)] = file_name
 
         for nested_enum in message.nested_enums:
@@ -256,6 +280,13 @@ class TypeMapper:
         for nested_message in message.nested_messages:
             self._register_message(nested_message, file_name=file_name)
 
+    def _register_symbol(self, full_name: str, symbol: _UESymbol) -> None:
+        previous = self._symbol_table_get(full_name)
+        if previous is not None:
+            self._used_ue_names.discard(previous.ue_name)
+        self._symbol_table[full_name] = symbol
+        self._used_ue_names.add(symbol.ue_name)
+
     def _resolve_type_name(self, full_name: str, prefix: str) -> str:
         override = self._rename_overrides.get(full_name)
         if override is not None:
@@ -269,7 +300,7 @@ class TypeMapper:
                     f"Rename override for '{full_name}' uses reserved UE identifier '{ue_name}'"
                 )
             if not self._is_name_available(ue_name):
-                existing = self._symbol_table.get(full_name)
+                existing = self._symbol_table_get(full_name)
                 if existing is not None and existing.ue_name == ue_name:
                     return ue_name
                 raise ValueError(
@@ -279,7 +310,7 @@ class TypeMapper:
         return self._compose_type_name(prefix, full_name)
 
     def _compose_type_name(self, prefix: str, full_name: str) -> str:
-        existing = self._symbol_table.get(full_name)
+        existing = self._symbol_table_get(full_name)
         if existing is not None:
             return existing.ue_name
         relative_path = self._relative_symbol_path(full_name)
@@ -289,23 +320,25 @@ class TypeMapper:
         return self._make_unique_type_name(prefix, suffix)
 
     def _make_unique_type_name(self, prefix: str, suffix: str) -> str:
+        is_available = self._is_name_available
         candidate = prefix + suffix
-        if self._is_name_available(candidate):
+        if is_available(candidate):
             return candidate
 
-        base_suffix = f"{self._COLLISION_INSERT}{suffix}" if suffix else self._COLLISION_INSERT
-        attempt = 1
+        base = prefix + self._COLLISION_INSERT + suffix
+        # Resume numbering where the last collision on this base stopped; the
+        # used-name set stays authoritative, the counter only skips known-taken
+        # candidates.
+        attempt = self._collision_counters.get(base, 0)
         while True:
-            adjusted_suffix = base_suffix if attempt == 1 else f"{base_suffix}{attempt - 1}"
-            candidate = prefix + adjusted_suffix
-            if self._is_name_available(candidate):
+            candidate = base + str(attempt) if attempt else base
+            if is_available(candidate):
+                self._collision_counters[base] = attempt + 1
                 return candidate
             attempt += 1
 
     def _is_name_available(self, name: str) -> bool:
-        if name in self._reserved_identifiers:
-            return False
-        return all(symbol.ue_name != name for symbol in self._symbol_table.values())
+        return name not in self._reserved_identifiers and name not in self._used_ue_names
 
     def _relative_symbol_path(self, full_name: str) -> List[str]:
         if not full_name:
@@ -344,7 +377,7 @@ class TypeMapper:
             full_name = type_name
         if not full_name:
             raise ValueError("Unable to resolve type without a full name")
-        symbol = self._symbol_table.get(full_name)
+        symbol = self._symbol_table_get(full_name)
         if symbol is None:
             raise KeyError(f"Type '{full_name}' was not registered in the UE symbol table")
         return symbol.ue_name
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import dataclasses
+import io
+
 import pytest
 
 pytest.importorskip("google.protobuf")
@@ -7,7 +10,13 @@ pytest.importorskip("google.protobuf")
 from google.protobuf import descriptor_pb2, descriptor_pool, message_factory
 from google.protobuf.compiler import plugin_pb2
 
-from proto2ue.codegen.converters import ConversionContext, ConvertersTemplate
+from proto2ue.codegen.converters import (
+    ConversionContext,
+    ConversionError,
+    ConvertersTemplate,
+    PythonConvertersRuntime,
+)
+from proto2ue.config import GeneratorConfig
 from proto2ue.descriptor_loader import DescriptorLoader
 from proto2ue.type_mapper import TypeMapper
 
@@ -191,6 +200,108 @@ def test_python_runtime_round_trip() -> None:
     assert proto_message.SerializeToString() == roundtrip_proto.SerializeToString()
 
 
+def test_converters_template_reuses_render_and_sees_file_changes() -> None:
+    ue_file, _ = _build_sample_components()
+    template = ConvertersTemplate(ue_file)
+    rendered = template.render()
+
+    assert template.render() is rendered
+
+    person = next(message for message in ue_file.messages if message.name == "Person")
+    person.ue_name = "FRenamedPerson"
+    updated = ConvertersTemplate(ue_file).render()
+
+    assert "FRenamedPerson" not in rendered.header
+    assert "FRenamedPerson" in updated.header
+
+
+def test_converters_template_write_streams_rendered_files() -> None:
+    ue_file, _ = _build_sample_components()
+    template = ConvertersTemplate(ue_file)
+    header, source = io.StringIO(), io.StringIO()
+
+    template.write(header, source)
+
+    rendered = template.render()
+    assert header.getvalue() == rendered.header
+    assert source.getvalue() == rendered.source
+
+
+def test_converters_template_can_emit_simdutf_string_helpers() -> None:
+    ue_file, _ = _build_sample_components()
+    default = ConvertersTemplate(ue_file).render()
+    rendered = ConvertersTemplate(
+        ue_file, GeneratorConfig(use_simdutf=True)
+    ).render()
+
+    assert "simdutf" not in default.header
+    assert "IsAsciiText(Value.data(), Value.size())" in default.header
+    assert "PROTO2UE_ASCII_SSE2" not in rendered.header
+    assert '#include "simdutf.h"' in rendered.header
+    assert "simdutf::convert_utf16_to_utf8" in rendered.header
+    assert "simdutf::convert_utf8_to_utf16" in rendered.header
+    assert rendered.source == default.source
+
+
+def test_converters_string_fallbacks_convert_the_full_length() -> None:
+    ue_file, _ = _build_sample_components()
+    default = ConvertersTemplate(ue_file).render()
+    simdutf = ConvertersTemplate(ue_file, GeneratorConfig(use_simdutf=True)).render()
+
+    for rendered in (default, simdutf):
+        assert "UTF8_TO_TCHAR" not in rendered.header
+        assert (
+            "FUTF8ToTCHAR Converter(Value.data(), static_cast<int32>(Value.size()));"
+            in rendered.header
+        )
+        assert "return FString(Converter.Length(), Converter.Get());" in rendered.header
+    assert "FTCHARToUTF8 Converter(Data, Length);" in default.header
+    assert "FTCHARToUTF8 Converter(*Value, Value.Len());" in simdutf.header
+
+
+def test_converters_template_keeps_value_traits_when_requested() -> None:
+    ue_file, _ = _build_sample_components()
+    rendered = ConvertersTemplate(
+        ue_file, GeneratorConfig(legacy_traits=True)
+    ).render()
+
+    assert "static bool IsValueProvided(const T& Value)" in rendered.header
+    assert "const bool bHasCase0 = IsValueProvided(Source.email);" in rendered.source
+    assert "GetFieldValue(Source.email)" in rendered.source
+
+
+
+def test_converters_template_emits_traits_for_wrapperless_oneof_members() -> None:
+    ue_file, _ = _build_sample_components()
+    person = next(message for message in ue_file.messages if message.name == "Person")
+    for field in person.fields:
+        if field.oneof_group:
+            field.optional_wrapper = None
+            field.is_optional = False
+
+    rendered = ConvertersTemplate(ue_file).render()
+
+    assert "IsValueProvided(Source.email)" in rendered.source
+    assert "GetFieldValue(Source.email)" in rendered.source
+    assert "static bool IsValueProvided(const T& Value)" in rendered.header
+    assert "static decltype(auto) GetFieldValue(const T& Value)" in rendered.header
+
+
+def test_converters_oneof_flags_stay_unique_for_case_variant_members() -> None:
+    ue_file, _ = _build_sample_components()
+    person = next(message for message in ue_file.messages if message.name == "Person")
+    email, phone = (field for field in person.fields if field.oneof_group)
+    email.source.name = "value"
+    phone.source.name = "Value"
+
+    rendered = ConvertersTemplate(ue_file).render()
+
+    assert "const bool bHasCase0 = Source.email.bIsSet;" in rendered.source
+    assert "const bool bHasCase1 = Source.phone.bIsSet;" in rendered.source
+    assert "bHasValue" not in rendered.source
+    assert "Out.set_value(" in rendered.source
+    assert "Out.set_Value(" in rendered.source
+
 def test_converters_template_emits_static_class_helpers() -> None:
     ue_file, _ = _build_sample_components()
     template = ConvertersTemplate(ue_file)
@@ -205,10 +316,109 @@ def test_converters_template_emits_static_class_helpers() -> None:
     assert f"class {expected_class}" in rendered.header
     assert f"void {expected_class}::ToProto" in rendered.source
     assert f"bool {expected_class}::FromProto" in rendered.source
+    assert "bOk = FromProto(Source.attributes(), Dest, Context) && bOk;" in rendered.source
     assert f"{expected_class}::FConversionContext" in rendered.source
-    assert f"{expected_class}::ToProtoBytes" in rendered.source
-    assert f"{expected_class}::FromProtoBytes" in rendered.source
+    assert "ProtoMessage.SerializeWithCachedSizesToArray(OutBytes.GetData());" in rendered.source
+    assert "ProtoMessage.ParseFromArray(InBytes.GetData(), InBytes.Num())" in rendered.source
+    assert "std::string Serialized" not in rendered.source
+    assert "static void ToProtoBytes(const TArray<uint8>& Value, std::string* Out)" in rendered.header
+    assert "Out.labels.Reserve(static_cast<int32>(Source.labels().size()));" in rendered.source
+    assert "auto& Value = Out.labels.Emplace(Key_labels);" in rendered.source
+    assert "FMemory::Memcpy(Out.scores.GetData(), Items.data(), sizeof(float) * Count);" in rendered.source
+    assert "const bool bHasCase0 = Source.email.bIsSet;" in rendered.source
+    assert "IsValueProvided" not in rendered.header
+    assert "} else if (bHasCase1) {" in rendered.source
+    assert "continue;" not in rendered.source
 
     assert '#include "example/person_proto2ue_converters.h"' in rendered.source
     assert '#include "example/person_proto2ue_converters.generated.h"' in rendered.header
 
+
+def test_python_runtime_reports_conversion_errors() -> None:
+    ue_file, person_cls = _build_sample_components()
+    runtime = ConvertersTemplate(ue_file).python_runtime()
+
+    context = ConversionContext()
+    runtime.to_proto(
+        "example.Person",
+        {
+            "id": 42,
+            "scores": 5,
+            "email": {"bIsSet": True, "Value": "a@example.com"},
+            "phone": {"bIsSet": True, "Value": "555"},
+        },
+        person_cls(),
+        context,
+    )
+
+    errors = {(error.field_path, error.message) for error in context.errors}
+    assert ("contact", "Multiple values provided for oneof") in errors
+    assert ("id", "Optional field expects a dictionary with wrapper members") in errors
+    assert ("scores", "Repeated field expects an iterable") in errors
+
+
+def test_python_runtime_can_skip_container_validation() -> None:
+    ue_file, person_cls = _build_sample_components()
+    template = ConvertersTemplate(ue_file)
+    checked = template.python_runtime()
+    unchecked = template.python_runtime(validate_containers=False)
+
+    ue_input = {
+        "scores": (1.0, 2.5),
+        "labels": {"team": {"created_by": {"bIsSet": True, "Value": "system"}}},
+    }
+    expected = checked.to_proto("example.Person", ue_input, person_cls())
+    context = ConversionContext()
+    actual = unchecked.to_proto("example.Person", ue_input, person_cls(), context)
+    assert not context.has_errors()
+    assert actual.SerializeToString() == expected.SerializeToString()
+
+    with pytest.raises(TypeError):
+        unchecked.to_proto("example.Person", {"scores": 5}, person_cls())
+
+
+@pytest.mark.parametrize(
+    "value", [5, "1.0", b"\x01", bytearray(b"\x01"), memoryview(b"\x01"), object()]
+)
+def test_python_runtime_rejects_non_sequence_repeated_values(value) -> None:
+    ue_file, person_cls = _build_sample_components()
+    runtime = ConvertersTemplate(ue_file).python_runtime()
+
+    context = ConversionContext()
+    proto_message = runtime.to_proto(
+        "example.Person", {"scores": value}, person_cls(), context
+    )
+
+    assert [(error.field_path, error.message) for error in context.errors] == [
+        ("scores", "Repeated field expects an iterable")
+    ]
+    assert list(proto_message.scores) == []
+
+
+def test_python_runtime_uses_file_messages_declared_after_their_users() -> None:
+    ue_file, person_cls = _build_sample_components()
+    reordered = dataclasses.replace(ue_file, messages=list(reversed(ue_file.messages)))
+    runtime = PythonConvertersRuntime(reordered)
+
+    context = ConversionContext()
+    proto_message = runtime.to_proto(
+        "example.Person",
+        {"labels": {"team": {"created_by": {"bIsSet": True, "Value": "system"}}}},
+        person_cls(),
+        context,
+    )
+
+    assert not context.has_errors()
+    assert proto_message.labels["team"].created_by == "system"
+
+
+def test_conversion_context_errors_returns_a_fresh_list() -> None:
+    context = ConversionContext()
+    context.add_error("id", "first")
+
+    errors = context.errors
+    errors.append(ConversionError("other", "ignored"))
+
+    assert isinstance(errors, list)
+    assert context.errors == [ConversionError("id", "first")]
+    assert context.errors is not context.errors
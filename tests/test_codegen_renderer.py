@@ -1,6 +1,9 @@
 from __future__ import annotations
 
+import dataclasses
+import io
 from pathlib import Path
+import sys
 
 import pytest
 
@@ -9,8 +12,11 @@ pytest.importorskip("google.protobuf")
 from google.protobuf import descriptor_pb2
 from google.protobuf.compiler import plugin_pb2
 
-from proto2ue.codegen import sanitize_generated_filename
+from proto2ue import plugin
+from proto2ue.codegen import DefaultTemplateRenderer, sanitize_generated_filename
+from proto2ue.descriptor_loader import DescriptorLoader
 from proto2ue.plugin import generate_code
+from proto2ue.type_mapper import TypeMapper
 
 
 def _build_sample_request() -> plugin_pb2.CodeGeneratorRequest:
@@ -398,3 +404,82 @@ def test_renderer_includes_cross_file_dependencies() -> None:
     assert header_output.index(dependency_include) < header_output.index(
         f'#include "{person_header[:-2]}.generated.h"'
     )
+
+
+def _build_multi_file_request(parameter: str = "") -> plugin_pb2.CodeGeneratorRequest:
+    request = plugin_pb2.CodeGeneratorRequest()
+    request.parameter = parameter
+    for index in range(3):
+        file_proto = request.proto_file.add()
+        file_proto.name = f"demo/file{index}.proto"
+        file_proto.package = "demo"
+        if index:
+            file_proto.dependency.append("demo/file0.proto")
+        message = file_proto.message_type.add()
+        message.name = f"Message{index}"
+        field = message.field.add()
+        field.name = "value"
+        field.number = 1
+        field.label = descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL
+        if index:
+            field.type = descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE
+            field.type_name = ".demo.Message0"
+        else:
+            field.type = descriptor_pb2.FieldDescriptorProto.TYPE_STRING
+        request.file_to_generate.append(file_proto.name)
+    return request
+
+
+def test_generate_code_parallel_rendering_matches_serial() -> None:
+    request = _build_multi_file_request()
+
+    serial = generate_code(request)
+    parallel = generate_code(request, parallel=True)
+
+    assert [(file.name, file.content) for file in parallel.file] == [
+        (file.name, file.content) for file in serial.file
+    ]
+
+
+def test_plugin_main_renders_in_parallel_when_requested(monkeypatch) -> None:
+    request = _build_multi_file_request("parallel=true")
+    calls = []
+    render_in_parallel = plugin._render_files_in_parallel
+
+    def spy(renderer, ue_files):
+        calls.append(len(ue_files))
+        return render_in_parallel(renderer, ue_files)
+
+    monkeypatch.setattr(plugin, "_render_files_in_parallel", spy)
+    stdout = io.BytesIO()
+    stdin = io.BytesIO(request.SerializeToString())
+    monkeypatch.setattr(sys, "stdin", io.TextIOWrapper(stdin))
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(stdout))
+
+    plugin.main()
+
+    response = plugin_pb2.CodeGeneratorResponse()
+    response.ParseFromString(stdout.getvalue())
+    serial = generate_code(request, parallel=False)
+    assert calls == [3]
+    assert [(file.name, file.content) for file in response.file] == [
+        (file.name, file.content) for file in serial.file
+    ]
+
+
+def test_renderer_reused_after_in_place_edit_sees_new_messages() -> None:
+    loader = DescriptorLoader(_build_sample_request())
+    loader.load()
+    mapper = TypeMapper()
+    mapper.register_files(loader.files.values())
+    ue_file = mapper.map_file(loader.get_file("example/person.proto"))
+    renderer = DefaultTemplateRenderer()
+
+    first_header = renderer.render(ue_file)[0].content
+    meta = next(message for message in ue_file.messages if message.name == "Meta")
+    ue_file.messages.append(dataclasses.replace(meta, ue_name="FExampleExtraMeta"))
+    second_header = renderer.render(ue_file)[0].content
+
+    assert "struct FExampleExtraMeta " not in first_header
+    assert "struct FExampleExtraMeta " in second_header
+    assert second_header == DefaultTemplateRenderer().render(ue_file)[0].content
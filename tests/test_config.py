@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+
 import pytest
 
 from proto2ue.config import DEFAULT_RESERVED_IDENTIFIERS, GeneratorConfig
@@ -9,6 +11,8 @@ def test_generator_config_defaults_include_reserved_identifiers() -> None:
     config = GeneratorConfig.from_parameter_string(None)
     assert config.reserved_identifiers == DEFAULT_RESERVED_IDENTIFIERS
     assert config.include_package_in_names is True
+    assert config.use_simdutf is False
+    assert config.legacy_traits is False
 
 
 def test_generator_config_allows_overriding_reserved_identifiers(tmp_path) -> None:
@@ -63,3 +67,37 @@ def test_generator_config_allows_disabling_package_names() -> None:
 def test_generator_config_rename_overrides_require_separator() -> None:
     with pytest.raises(ValueError):
         GeneratorConfig.from_parameter_string("rename_overrides=invalid-entry")
+
+
+def test_generator_config_parses_use_simdutf() -> None:
+    config = GeneratorConfig.from_parameter_string("use_simdutf=true")
+
+    assert config.use_simdutf is True
+
+
+def test_generator_config_parses_legacy_traits() -> None:
+    config = GeneratorConfig.from_parameter_string("legacy_traits=yes")
+
+    assert config.legacy_traits is True
+
+
+def test_generator_config_rereads_identifier_file_after_change(tmp_path) -> None:
+    reserved_file = tmp_path / "reserved.txt"
+    reserved_file.write_text("FFirst\n", encoding="utf-8")
+    parameter = f"reserved_identifiers=FBase,reserved_identifiers_file={reserved_file}"
+
+    first = GeneratorConfig.from_parameter_string(parameter)
+    again = GeneratorConfig.from_parameter_string(parameter)
+    assert first.reserved_identifiers == again.reserved_identifiers == ("FBase", "FFirst")
+
+    reserved_file.write_text("FSecond\n", encoding="utf-8")
+    stat = reserved_file.stat()
+    os.utime(reserved_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    updated = GeneratorConfig.from_parameter_string(parameter)
+    assert updated.reserved_identifiers == ("FBase", "FSecond")
+
+
+def test_generator_config_parses_parallel() -> None:
+    assert GeneratorConfig.from_parameter_string(None).parallel is False
+    assert GeneratorConfig.from_parameter_string("parallel=true").parallel is True
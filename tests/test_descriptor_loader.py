@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+
 import pytest
 
 pytest.importorskip("google.protobuf")
@@ -7,6 +9,7 @@ pytest.importorskip("google.protobuf")
 from google.protobuf import descriptor_pb2, json_format
 from google.protobuf.compiler import plugin_pb2
 
+from proto2ue import descriptor_loader
 from proto2ue.descriptor_loader import DescriptorLoader, OptionContext
 from proto2ue import model
 
@@ -155,6 +158,8 @@ def test_normalize_options_legacy_message_to_dict(monkeypatch: pytest.MonkeyPatc
     loader = DescriptorLoader(request)
     options = descriptor_pb2.FileOptions()
     options.java_multiple_files = True
+    # Uninterpreted options are left to MessageToDict by the direct walk.
+    options.uninterpreted_option.add(positive_int_value=7)
 
     called: dict[str, object] = {}
 
@@ -189,6 +194,8 @@ def test_normalize_options_new_message_to_dict(monkeypatch: pytest.MonkeyPatch)
     loader = DescriptorLoader(request)
     options = descriptor_pb2.FileOptions()
     options.java_multiple_files = True
+    # Uninterpreted options are left to MessageToDict by the direct walk.
+    options.uninterpreted_option.add(positive_int_value=7)
 
     call_count = 0
 
@@ -215,3 +222,210 @@ def test_normalize_options_new_message_to_dict(monkeypatch: pytest.MonkeyPatch)
 
     assert normalized == {"javaMultipleFiles": True}
     assert call_count == 2
+
+
+def test_message_to_dict_passes_legacy_keywords(monkeypatch: pytest.MonkeyPatch) -> None:
+    request = plugin_pb2.CodeGeneratorRequest()
+    loader = DescriptorLoader(request)
+    options = descriptor_pb2.FileOptions()
+    options.java_multiple_files = True
+
+    called: dict[str, object] = {}
+
+    def legacy_message_to_dict(
+        message: descriptor_pb2.FileOptions,
+        *,
+        preserving_proto_field_name: bool,
+        including_default_value_fields: bool,
+    ) -> dict[str, object]:
+        called["message"] = message
+        called["preserving_proto_field_name"] = preserving_proto_field_name
+        called["including_default_value_fields"] = including_default_value_fields
+        return {"javaMultipleFiles": True}
+
+    monkeypatch.setattr(json_format, "MessageToDict", legacy_message_to_dict)
+
+    normalized = loader._message_to_dict(options)
+
+    assert normalized == {"javaMultipleFiles": True}
+    assert called == {
+        "message": options,
+        "preserving_proto_field_name": True,
+        "including_default_value_fields": False,
+    }
+
+
+def test_message_to_dict_retries_without_removed_keywords(monkeypatch: pytest.MonkeyPatch) -> None:
+    request = plugin_pb2.CodeGeneratorRequest()
+    loader = DescriptorLoader(request)
+    options = descriptor_pb2.FileOptions()
+    options.java_multiple_files = True
+
+    call_count = 0
+
+    def new_message_to_dict(
+        message: descriptor_pb2.FileOptions,
+        *,
+        preserving_proto_field_name: bool,
+        **kwargs: object,
+    ) -> dict[str, object]:
+        nonlocal call_count
+        call_count += 1
+        assert message is options
+        assert preserving_proto_field_name is True
+        if "including_default_value_fields" in kwargs:
+            raise TypeError("unexpected keyword argument")
+        return {"javaMultipleFiles": True}
+
+    monkeypatch.setattr(json_format, "MessageToDict", new_message_to_dict)
+
+    normalized = loader._message_to_dict(options)
+
+    assert normalized == {"javaMultipleFiles": True}
+    assert call_count == 2
+
+    assert loader._message_to_dict(options) == {"javaMultipleFiles": True}
+    assert call_count == 3
+
+
+def test_normalize_options_skips_conversion_for_empty_options(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    request = plugin_pb2.CodeGeneratorRequest()
+    loader = DescriptorLoader(request)
+    context = OptionContext(element_type="field", file_name="example.proto")
+
+    call_count = 0
+    original = descriptor_loader._options_to_dict
+
+    def counting_options_to_dict(message: descriptor_pb2.FieldOptions) -> dict[str, object] | None:
+        nonlocal call_count
+        call_count += 1
+        return original(message)
+
+    monkeypatch.setattr(descriptor_loader, "_options_to_dict", counting_options_to_dict)
+
+    first = loader._normalize_options(descriptor_pb2.FieldOptions(deprecated=True), context)
+    second = loader._normalize_options(descriptor_pb2.FieldOptions(deprecated=True), context)
+    empty = loader._normalize_options(descriptor_pb2.FieldOptions(), context)
+
+    assert first == second == {"deprecated": True}
+    assert first is not second
+    assert empty == {}
+    assert call_count == 2
+
+
+def test_loader_converts_only_requested_files_and_their_imports() -> None:
+    request = _build_request()
+    base = descriptor_pb2.FileDescriptorProto(name="base.proto", package="base")
+    base.message_type.add(name="Base")
+    unrelated = descriptor_pb2.FileDescriptorProto(name="unrelated.proto", package="other")
+    unrelated.message_type.add(name="Other")
+    request.proto_file[0].dependency.append("base.proto")
+    request.proto_file.insert(0, base)
+    request.proto_file.append(unrelated)
+    loader = DescriptorLoader(request)
+
+    loaded = loader.load(["example.proto"])
+
+    assert list(loaded) == ["example.proto"]
+    assert "unrelated.proto" not in loader._loaded_files
+    assert loader.get_file("base.proto").messages[0].full_name == "base.Base"
+
+    assert list(loader.files) == ["base.proto", "example.proto", "unrelated.proto"]
+
+
+def test_normalize_options_matches_message_to_dict() -> None:
+    request = plugin_pb2.CodeGeneratorRequest()
+    loader = DescriptorLoader(request)
+    context = OptionContext(element_type="file", file_name="example.proto")
+
+    file_options = descriptor_pb2.FileOptions(
+        java_package="com.example",
+        optimize_for=descriptor_pb2.FileOptions.CODE_SIZE,
+        cc_enable_arenas=True,
+    )
+    field_options = descriptor_pb2.FieldOptions(
+        ctype=descriptor_pb2.FieldOptions.CORD,
+        targets=[
+            descriptor_pb2.FieldOptions.TARGET_TYPE_FIELD,
+            descriptor_pb2.FieldOptions.TARGET_TYPE_FILE,
+        ],
+    )
+    uninterpreted = descriptor_pb2.MessageOptions()
+    uninterpreted.uninterpreted_option.add(identifier_value="custom", positive_int_value=7)
+
+    for options in (file_options, field_options, uninterpreted):
+        assert loader._normalize_options(options, context) == loader._message_to_dict(options)
+    assert descriptor_loader._options_to_dict(uninterpreted) is None
+
+
+def test_loader_cache_reuses_files_across_instances(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(descriptor_loader, "_FILE_CACHE", OrderedDict())
+    base = descriptor_pb2.FileDescriptorProto(name="base.proto", package="base")
+    base.message_type.add(name="Base")
+
+    def build_request() -> plugin_pb2.CodeGeneratorRequest:
+        request = _build_request()
+        meta = request.proto_file[0].message_type[1]
+        meta.field.add(
+            name="base",
+            number=1,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+            type=descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE,
+            type_name=".base.Base",
+        )
+        request.proto_file[0].dependency.append("base.proto")
+        request.proto_file.insert(0, base)
+        return request
+
+    first = DescriptorLoader(build_request(), enable_cache=True)
+    first_files = first.load()
+    converted = 0
+    original = DescriptorLoader._build_file
+
+    def counting_build_file(self, file_proto):
+        nonlocal converted
+        converted += 1
+        return original(self, file_proto)
+
+    monkeypatch.setattr(DescriptorLoader, "_build_file", counting_build_file)
+    second = DescriptorLoader(build_request(), enable_cache=True)
+    second_files = second.load()
+
+    assert converted == 0
+    thing = second_files["example.proto"].messages[0]
+    meta = second_files["example.proto"].messages[1]
+    assert thing is not first_files["example.proto"].messages[0]
+    assert thing.fields[0].map_entry.value_resolved_type is meta
+    assert meta.fields[0].resolved_type is second_files["base.proto"].messages[0]
+    assert thing.oneofs[0].fields[0] is thing.fields[2]
+
+
+def test_loader_parallel_conversion_matches_sequential() -> None:
+    def build_request() -> plugin_pb2.CodeGeneratorRequest:
+        request = _build_request()
+        base = descriptor_pb2.FileDescriptorProto(name="base.proto", package="base")
+        base.message_type.add(name="Base")
+        meta = request.proto_file[0].message_type[1]
+        meta.field.add(
+            name="base",
+            number=1,
+            label=descriptor_pb2.FieldDescriptorProto.LABEL_OPTIONAL,
+            type=descriptor_pb2.FieldDescriptorProto.TYPE_MESSAGE,
+            type_name=".base.Base",
+        )
+        request.proto_file[0].dependency.append("base.proto")
+        request.proto_file.insert(0, base)
+        return request
+
+    sequential = DescriptorLoader(build_request()).load()
+    parallel = DescriptorLoader(build_request(), parallel=True).load()
+
+    assert list(parallel) == list(sequential)
+    thing = parallel["example.proto"].messages[0]
+    meta = parallel["example.proto"].messages[1]
+    assert thing.fields[0].map_entry.value_resolved_type is meta
+    assert thing.fields[1].resolved_type is parallel["example.proto"].enums[0]
+    assert meta.fields[0].resolved_type is parallel["base.proto"].messages[0]
+    assert thing.options == sequential["example.proto"].messages[0].options
@@ -750,6 +750,20 @@ def test_type_mapper_renames_reserved_identifiers_from_config() -> None:
     assert holder.fields[0].base_type == "FProtoPhysicsVector"
 
 
+def test_type_mapper_numbers_repeated_reserved_collisions() -> None:
+    proto_file = _build_reserved_collision_model()
+    config = GeneratorConfig(
+        reserved_identifiers=("FPhysicsVector", "FProtoPhysicsVector", "FProtoPhysicsVector1")
+    )
+
+    mapper = TypeMapper(config=config)
+    ue_file = mapper.map_file(proto_file)
+
+    vector = next(message for message in ue_file.messages if message.name == "Vector")
+
+    assert vector.ue_name == "FProtoPhysicsVector2"
+
+
 def test_type_mapper_respects_rename_overrides() -> None:
     proto_file = _build_reserved_collision_model()
     config = GeneratorConfig(rename_overrides={"physics.Vector": "FPhysicsVector"})